@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 from datetime import datetime
 from pathlib import Path
@@ -9,11 +10,20 @@ from pathlib import Path
 
 def create_backup_path(vault_root: Path, file_path: Path, backup_ext: str) -> Path:
     """Create backup path that mirrors the vault structure in a backup folder."""
-    backup_root = vault_root.parent / f"{vault_root.name}_backups"
-    relative_path = file_path.relative_to(vault_root)
-    backup_path = backup_root / relative_path
-    backup_path = backup_path.with_suffix(backup_path.suffix + backup_ext)
-    return backup_path
+    # Slice and join as strings and build a single Path at the end: this runs
+    # once per file, and every `/` on a Path re-parses the whole path
+    root = str(vault_root)
+    path = str(file_path)
+    prefix = root if root.endswith(os.sep) else root + os.sep
+    if not path.startswith(prefix) or len(path) == len(prefix):
+        raise ValueError(f"{file_path} is not in the subpath of {vault_root}")
+    return Path(
+        os.path.join(
+            vault_root.parent,
+            f"{vault_root.name}_backups",
+            path[len(prefix) :] + backup_ext,
+        )
+    )
 
 
 def clear_backups(vault_root: Path) -> int:
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import math
 import re
-from datetime import datetime
+from collections.abc import Iterator
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 
 from ..config import Config
@@ -33,6 +36,40 @@ _DEFAULT_DATE_PATTERNS = [
     r"(\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.?\s+\d{1,2},?\s+\d{4})",
 ]
 
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}\Z", re.ASCII)
+_LEADING_WHITESPACE_RE = re.compile(r"\s*")
+_BACKREFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+@lru_cache(maxsize=32)
+def _compile_date_patterns(
+    patterns: tuple[str, ...],
+) -> tuple[re.Pattern[str] | None, tuple[re.Pattern[str], ...]]:
+    """Compile date patterns once per distinct pattern list.
+
+    Besides the individual patterns, builds a single alternation of all of them
+    so lines without any date are rejected in one scan instead of one per
+    pattern.
+
+    Args:
+        patterns: Date regex patterns, each capturing the date in group 1.
+
+    Returns:
+        Tuple of (combined pattern or None if the patterns cannot be combined,
+        tuple of compiled case-insensitive patterns).
+    """
+    compiled = tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+    # Group backreferences would point at the wrong group once combined
+    if any(_BACKREFERENCE_RE.search(pattern) for pattern in patterns):
+        return None, compiled
+    try:
+        combined = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE
+        )
+    except re.error:
+        combined = None
+    return combined, compiled
+
 
 def parse_date_string(date_str: str, config: Config | None = None) -> datetime | None:
     """Parse various date string formats into a datetime object.
@@ -46,6 +83,14 @@ def parse_date_string(date_str: str, config: Config | None = None) -> datetime |
     """
     date_formats = config.processing.date_formats if config else _DEFAULT_DATE_FORMATS
 
+    # ISO dates are by far the most common, and building the datetime directly
+    # is much cheaper than going through strptime's format parser
+    if date_formats and date_formats[0] == "%Y-%m-%d" and _ISO_DATE_RE.match(date_str):
+        try:
+            return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+        except ValueError:
+            pass
+
     for fmt in date_formats:
         try:
             return datetime.strptime(date_str, fmt)
@@ -71,54 +116,92 @@ def extract_date_from_body(body: str, config: Config | None = None) -> str | Non
     if not body:
         return None
 
-    date_patterns = (
-        config.processing.date_patterns if config else _DEFAULT_DATE_PATTERNS
+    any_date_pattern, date_patterns = _compile_date_patterns(
+        tuple(config.processing.date_patterns if config else _DEFAULT_DATE_PATTERNS)
     )
 
-    # Split body into lines and check only the first 10 lines
-    lines = body.strip().split("\n")[:10]
-
-    for line in lines:
+    # Check only the first 10 lines, without splitting the whole body
+    for line in _first_lines(body, _LEADING_WHITESPACE_RE.match(body).end(), 10):
         # Skip empty lines and lines that are just headers
         line = line.strip()
         if not line or line.startswith("#"):
             continue
 
+        # Most lines hold no date: rule them out with a single scan, then find
+        # which pattern matches in priority order
+        if any_date_pattern is not None and not any_date_pattern.search(line):
+            continue
+
         for pattern in date_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
+            match = pattern.search(line)
             if match:
                 date_str = match.group(1)
                 try:
                     # Try to parse the date and convert to ISO format
                     parsed_date = parse_date_string(date_str, config)
                     if parsed_date:
-                        return parsed_date.strftime("%Y-%m-%d")
+                        return parsed_date.date().isoformat()
                 except Exception:
                     continue
 
     return None
 
 
-def get_file_creation_date(path: Path) -> str:
-    """Get the file creation date in ISO format.
+def _first_lines(text: str, start: int, count: int) -> Iterator[str]:
+    """Yield up to `count` lines of text, starting at index `start`.
+
+    Args:
+        text: Text to read lines from.
+        start: Index to start reading at.
+        count: Maximum number of lines to yield.
+
+    Yields:
+        Lines of text without their trailing newline.
+    """
+    for _ in range(count):
+        end = text.find("\n", start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def get_file_dates(path: Path) -> tuple[str, str]:
+    """Get the file creation and modification dates from a single stat call.
 
     Args:
         path: Path to the file.
 
     Returns:
-        Date string in ISO format (YYYY-MM-DD).
+        Tuple of (creation date, modification date) strings in ISO format
+        (YYYY-MM-DD). Both are the current date if the file cannot be read.
     """
     try:
-        # On macOS, use st_birthtime for creation time
         stat = path.stat()
-        # macOS/BSD creation time, fallback to modification time on other systems
-        creation_time = getattr(stat, "st_birthtime", stat.st_mtime)
-
-        # Convert to ISO format date string
-        return datetime.fromtimestamp(creation_time).strftime("%Y-%m-%d")
     except OSError:
-        # If we can't get the creation date, use current date
-        return datetime.now().strftime("%Y-%m-%d")
+        # If we can't get the file dates, use current date
+        today = date.today().isoformat()
+        return today, today
+
+    # macOS/BSD creation time, fallback to modification time on other systems
+    creation_time = getattr(stat, "st_birthtime", stat.st_mtime)
+    return (
+        _timestamp_to_date(math.floor(creation_time)),
+        _timestamp_to_date(math.floor(stat.st_mtime)),
+    )
+
+
+def get_file_creation_date(path: Path) -> str:
+    """Get the file creation date in ISO format.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Date string in ISO format (YYYY-MM-DD).
+    """
+    return get_file_dates(path)[0]
 
 
 def get_file_modification_date(path: Path) -> str:
@@ -130,11 +213,20 @@ def get_file_modification_date(path: Path) -> str:
     Returns:
         Date string in ISO format (YYYY-MM-DD).
     """
-    try:
-        stat = path.stat()
-        modification_time = stat.st_mtime
-        # Convert to ISO format date string
-        return datetime.fromtimestamp(modification_time).strftime("%Y-%m-%d")
-    except OSError:
-        # If we can't get the modification date, use current date
-        return datetime.now().strftime("%Y-%m-%d")
+    return get_file_dates(path)[1]
+
+
+@lru_cache(maxsize=4096)
+def _timestamp_to_date(timestamp: int) -> str:
+    """Convert a whole-second timestamp to a local ISO date string.
+
+    Creation dates fall back to the modification time off macOS, and syncs
+    touch many files within the same second, so conversions are memoized.
+
+    Args:
+        timestamp: POSIX timestamp truncated to whole seconds.
+
+    Returns:
+        Date string in ISO format (YYYY-MM-DD).
+    """
+    return date.fromtimestamp(timestamp).isoformat()
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+import os
+from collections.abc import Container, Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -12,16 +13,32 @@ if TYPE_CHECKING:
     from typing import Any
 
 
-def walk_markdown_files(root: Path) -> Iterator[Path]:
+def walk_markdown_files(root: Path, exclude: Container[Path] = ()) -> Iterator[Path]:
     """Walk through the directory to find .md files.
 
+    Uses ``os.scandir`` so each entry's type comes from the cached directory
+    listing instead of a separate ``stat()`` per path. Symlinked directories
+    are not followed, matching ``Path.rglob``.
+
     Args:
         root: Root directory to search.
+        exclude: Directories to skip without descending into them.
 
     Yields:
         Path objects for each markdown file found.
     """
-    return root.rglob("*.md")
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdir = Path(entry.path)
+                    if subdir not in exclude:
+                        yield from walk_markdown_files(subdir, exclude)
+                elif entry.name.endswith(".md"):
+                    yield Path(entry.path)
+    except OSError:
+        # Unreadable or vanished directories are skipped, as rglob does
+        return
 
 
 def process_file(
@@ -45,7 +62,9 @@ def process_file(
         config: Optional configuration object.
 
     Returns:
-        Dictionary with statistics about the processing (added_tags, removed_tags, processed).
+        Dictionary with statistics about the processing (added_tags, removed_tags,
+        processed, error). error is True when the file could not be read or
+        written.
     """
     from ..backup.operations import create_backup_path
     from ..core.formatting import format_markdown
@@ -57,13 +76,14 @@ def process_file(
     from ..core.tags import extract_granola_link, extract_tags
     from ..utils import log_change
 
-    stats = {"added_tags": 0, "removed_tags": 0, "processed": False}
+    stats = {"added_tags": 0, "removed_tags": 0, "processed": False, "error": False}
 
     try:
         with path.open("r", encoding="utf-8") as file:
             text = file.read()
     except (OSError, UnicodeDecodeError) as e:
         logger.error(f"Error reading {path}: {e}")
+        stats["error"] = True
         return stats
 
     frontmatter, body = split_frontmatter(text)
@@ -111,7 +131,7 @@ def process_file(
 
         # Use rich logging for changes
         if added_tags or removed_tags:
-            log_change(path, added_tags, removed_tags, dry_run)
+            log_change(path, len(added_tags), len(removed_tags), dry_run)
 
         if not dry_run:
             stats["processed"] = True
@@ -155,6 +175,7 @@ def process_file(
             except OSError as e:
                 logger.error(f"Error writing {path}: {e}")
                 stats["processed"] = False
+                stats["error"] = True
                 return stats
         else:
             actions = []
@@ -12,6 +12,20 @@ from ..utils import console
 
 MDFORMAT_GFM_AVAILABLE = importlib.util.find_spec("mdformat_gfm") is not None
 
+# Table detection pattern: pipe table with header separator
+# Matches separator lines like |----------|----------|----------|
+_TABLE_SEPARATOR_RE = re.compile(r"\n\s*\|[-: |]+\|\s*\n")
+
+# Text made only of letters, spaces and sentence punctuation cannot contain any
+# markdown syntax other than paragraphs and hard line breaks
+_PLAIN_TEXT_RE = re.compile(r"[A-Za-z ,.;:?'\"\n]*\Z")
+
+# Unordered lists (-, *, +), ordered lists (1., 2., etc.) and lettered lists
+# like a., b., i., ii., etc.
+_UNORDERED_ITEM_RE = re.compile(r"^([ \t]*)([-*+])[ \t]+(.*)$")
+_ORDERED_ITEM_RE = re.compile(r"^([ \t]*)(\d+\.)[ \t]+(.*)$")
+_LETTERED_ITEM_RE = re.compile(r"^([ \t]*)([a-z]+\.|[ivx]+\.)[ \t]+(.*)$")
+
 
 def format_markdown(text: str) -> str:
     """Format markdown text using mdformat for consistent styling.
@@ -29,14 +43,21 @@ def format_markdown(text: str) -> str:
     Returns:
         Formatted markdown text.
     """
-    # Table detection pattern: pipe table with header separator
-    # Matches separator lines like |----------|----------|----------|
-    table_pattern = r"\n\s*\|[-: |]+\|\s*\n"
-    has_table = bool(re.search(table_pattern, text))
-
-    extensions = {"gfm"} if MDFORMAT_GFM_AVAILABLE else None
-
-    if has_table and not MDFORMAT_GFM_AVAILABLE:
+    # Plain prose (without indented code blocks) formats predictably, so skip
+    # the markdown parser for it
+    if (
+        _PLAIN_TEXT_RE.match(text)
+        and not text.startswith("    ")
+        and "\n    " not in text
+    ):
+        return _format_plain_text(text)
+
+    options = {"wrap": "no", "number": False}
+    extensions = ("gfm",) if MDFORMAT_GFM_AVAILABLE else ()
+
+    # Table detection is only needed when tables could be corrupted, so the
+    # usual path with mdformat-gfm installed never scans for them
+    if not MDFORMAT_GFM_AVAILABLE and _has_pipe_table(text):
         console.print(
             "[yellow]Warning: Detected pipe table but mdformat-gfm plugin is unavailable. "
             "Skipping formatting to prevent table corruption.[/]"
@@ -44,42 +65,26 @@ def format_markdown(text: str) -> str:
         return text
 
     try:
-        result = mdformat.text(
-            text,
-            options={
-                "wrap": "no",
-                "number": False,
-            },
-            extensions=extensions or (),
-        )
-
-        cleaned_result = _clean_list_blank_lines(result)
-
-        return str(cleaned_result)
+        result = mdformat.text(text, options=options, extensions=extensions)
     except (ImportError, KeyError, ValueError):
-        # mdformat-gfm plugin is not available
-        if has_table:
+        # mdformat-gfm plugin failed to load. Retrying without extensions is
+        # only a different call when GFM was requested, and is only safe
+        # without tables
+        if _has_pipe_table(text):
             console.print(
                 "[yellow]Warning: Detected pipe table but mdformat-gfm plugin is unavailable. "
                 "Skipping formatting to prevent table corruption.[/]"
             )
             return text
-        # If no tables, proceed with basic mdformat (fallback)
+        if not extensions:
+            return text
         try:
-            result = mdformat.text(
-                text,
-                options={
-                    "wrap": "no",
-                    "number": False,
-                },
-            )
-            cleaned_result = _clean_list_blank_lines(result)
-            return str(cleaned_result)
+            result = mdformat.text(text, options=options)
         except Exception:
             return text
     except Exception:
         # If other formatting issues occur
-        if has_table:
+        if _has_pipe_table(text):
             console.print(
                 "[yellow]Warning: Detected pipe table but formatting failed. "
                 "Skipping formatting to prevent table corruption.[/]"
@@ -88,6 +93,55 @@ def format_markdown(text: str) -> str:
         # If no tables, return original text as fallback
         return text
 
+    return str(_clean_list_blank_lines(result))
+
+
+def _has_pipe_table(text: str) -> bool:
+    """Check if the text contains a pipe table header separator.
+
+    Args:
+        text: Markdown text to check.
+
+    Returns:
+        True if a pipe table is detected, False otherwise.
+    """
+    return "|" in text and _TABLE_SEPARATOR_RE.search(text) is not None
+
+
+def _format_plain_text(text: str) -> str:
+    """Format markdown-free text exactly as mdformat would.
+
+    Paragraphs are separated by a single blank line and each is put on one
+    line with single spaces, except that lines ending in two or more spaces
+    become backslash hard breaks.
+
+    Args:
+        text: Text matching `_PLAIN_TEXT_RE`, with no line indented by four
+            or more spaces.
+
+    Returns:
+        Formatted text, ending in a newline unless it is empty.
+    """
+    paragraphs = []
+    current = ""
+    hard_break = False
+    for line in text.split("\n"):
+        words = line.split()
+        if not words:
+            if current:
+                paragraphs.append(current)
+                current = ""
+            continue
+        joined = " ".join(words)
+        if current:
+            current += ("\\\n" if hard_break else " ") + joined
+        else:
+            current = joined
+        hard_break = line.endswith("  ")
+    if current:
+        paragraphs.append(current)
+    return "\n\n".join(paragraphs) + "\n" if paragraphs else ""
+
 
 def _clean_list_blank_lines(text: str) -> str:
     """Remove blank lines between consecutive list items at the same indent level.
@@ -192,14 +246,8 @@ def _parse_list_item(line: str) -> dict[str, Any] | None:
     Returns:
         Dictionary with list item info or None.
     """
-    # Match unordered lists (-, *, +) and ordered lists (1., 2., etc.)
-    unordered_pattern = r"^([ \t]*)([-*+])[ \t]+(.*)$"
-    ordered_pattern = r"^([ \t]*)(\d+\.)[ \t]+(.*)$"
-    # Also match lettered lists like a., b., i., ii., etc.
-    lettered_pattern = r"^([ \t]*)([a-z]+\.|[ivx]+\.)[ \t]+(.*)$"
-
     # Try unordered list pattern first
-    match = re.match(unordered_pattern, line)
+    match = _UNORDERED_ITEM_RE.match(line)
     if match:
         return {
             "indent": len(match.group(1)),
@@ -209,7 +257,7 @@ def _parse_list_item(line: str) -> dict[str, Any] | None:
         }
 
     # Try ordered list pattern
-    match = re.match(ordered_pattern, line)
+    match = _ORDERED_ITEM_RE.match(line)
     if match:
         return {
             "indent": len(match.group(1)),
@@ -219,7 +267,7 @@ def _parse_list_item(line: str) -> dict[str, Any] | None:
         }
 
     # Try lettered list pattern
-    match = re.match(lettered_pattern, line)
+    match = _LETTERED_ITEM_RE.match(line)
     if match:
         return {
             "indent": len(match.group(1)),
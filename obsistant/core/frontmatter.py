@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import re
+from datetime import date
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +11,18 @@ import yaml
 
 from ..config import Config
 
+# libyaml's loader produces the same data several times faster; fall back to
+# the pure-Python one when PyYAML was built without it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Strings PyYAML emits as plain scalars: identifier-like words and URLs
+_PLAIN_SCALAR_RE = re.compile(
+    r"[A-Za-z][\w./-]*\Z|https?://[\w./?=&%+~:-]*\Z", re.ASCII
+)
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}\Z")
+# Words PyYAML would resolve to booleans or null and therefore quote
+_YAML_KEYWORDS = frozenset({"yes", "no", "true", "false", "on", "off", "null"})
+
 
 def split_frontmatter(text: str) -> tuple[dict[str, Any] | None, str]:
     """Split the front matter and return it with the content.
@@ -19,17 +33,24 @@ def split_frontmatter(text: str) -> tuple[dict[str, Any] | None, str]:
     Returns:
         Tuple of (frontmatter dict or None, content string).
     """
-    if text.startswith("---"):
-        parts = text.split("---", 2)
-        if len(parts) >= 3:
-            try:
-                frontmatter = yaml.safe_load(parts[1])
-                content = parts[2]
-                return frontmatter, content
-            except yaml.YAMLError:
-                # If YAML parsing fails, treat as no frontmatter
-                return None, text
-    return None, text
+    if not text.startswith("---"):
+        return None, text
+
+    # Locate the closing delimiter directly instead of splitting the whole text
+    end = text.find("---", 3)
+    if end == -1:
+        return None, text
+
+    yaml_text = text[3:end]
+    content = text[end + 3 :]
+    if not yaml_text.strip(" \r\n"):
+        # Empty frontmatter block, nothing for the YAML parser to do
+        return None, content
+    try:
+        return yaml.load(yaml_text, Loader=_YamlLoader), content
+    except yaml.YAMLError:
+        # If YAML parsing fails, treat as no frontmatter
+        return None, text
 
 
 def merge_frontmatter(
@@ -55,15 +76,14 @@ def merge_frontmatter(
     Returns:
         Merged frontmatter dictionary.
     """
-    from .dates import (
-        extract_date_from_body,
-        get_file_creation_date,
-        get_file_modification_date,
-    )
+    from .dates import extract_date_from_body, get_file_dates
 
     if orig is None:
         orig = {}
 
+    # Stat the file once for both the creation and modification dates
+    file_dates = get_file_dates(file_path) if file_path else None
+
     # Create a new ordered dictionary with the specific order we want
     result = {}
 
@@ -80,10 +100,8 @@ def merge_frontmatter(
                 dates_to_compare.append(body_date)
 
         # Get file creation date if file_path is provided
-        if file_path:
-            file_creation_date = get_file_creation_date(file_path)
-            if file_creation_date:
-                dates_to_compare.append(file_creation_date)
+        if file_dates:
+            dates_to_compare.append(file_dates[0])
 
         # Use the earliest date found
         if dates_to_compare:
@@ -92,8 +110,8 @@ def merge_frontmatter(
             result["created"] = dates_to_compare[0]
 
     # 2. Add modification date - always update to latest file modification date
-    if file_path:
-        result["modified"] = get_file_modification_date(file_path)
+    if file_dates:
+        result["modified"] = file_dates[1]
 
     # 3. Add meeting-transcript if provided
     if meeting_transcript:
@@ -102,8 +120,9 @@ def merge_frontmatter(
         result["meeting-transcript"] = orig["meeting-transcript"]
 
     # 4. Handle tags
-    orig_tags = set(orig.get("tags", []))
-    merged_tags = orig_tags.union(tags)
+    # Build the union in a single set rather than copying both sides
+    merged_tags = set(tags)
+    merged_tags.update(orig.get("tags", []))
 
     # Only set tags if we have any
     if merged_tags:
@@ -129,4 +148,67 @@ def render_frontmatter(data: dict[str, Any]) -> str:
     Returns:
         YAML frontmatter string with delimiters.
     """
-    return "---\n" + yaml.safe_dump(data, sort_keys=False) + "---\n"
+    rendered = _render_simple_yaml(data)
+    if rendered is None:
+        rendered = yaml.safe_dump(data, sort_keys=False)
+    return "---\n" + rendered + "---\n"
+
+
+def _render_simple_yaml(data: dict[str, Any]) -> str | None:
+    """Render flat frontmatter without going through the YAML emitter.
+
+    Typical frontmatter is a handful of plain strings, dates and tag lists.
+    For those shapes the output is identical to ``yaml.safe_dump(data,
+    sort_keys=False)``; anything else returns None so the caller falls back
+    to PyYAML.
+
+    Args:
+        data: Dictionary to render.
+
+    Returns:
+        YAML string without delimiters, or None if the data is not simple.
+    """
+    if not data:
+        return None
+
+    lines = []
+    for key, value in data.items():
+        # Long keys are emitted by PyYAML as complex "? key" entries
+        if not isinstance(key, str) or len(key) > 64 or _render_scalar(key) != key:
+            return None
+        if type(value) is list:
+            if not value:
+                return None
+            lines.append(f"{key}:\n")
+            for item in value:
+                rendered_item = _render_scalar(item)
+                if rendered_item is None:
+                    return None
+                lines.append(f"- {rendered_item}\n")
+        else:
+            rendered_value = _render_scalar(value)
+            if rendered_value is None:
+                return None
+            lines.append(f"{key}: {rendered_value}\n")
+    return "".join(lines)
+
+
+def _render_scalar(value: Any) -> str | None:
+    """Render a scalar the way PyYAML's safe dumper would, if it is simple.
+
+    Args:
+        value: Scalar value to render.
+
+    Returns:
+        Rendered scalar, or None if it needs the full YAML emitter.
+    """
+    if type(value) is str:
+        if _PLAIN_SCALAR_RE.match(value) and value.lower() not in _YAML_KEYWORDS:
+            return value
+        if _ISO_DATE_RE.match(value):
+            # Quoted so YAML keeps it a string rather than a timestamp
+            return f"'{value}'"
+        return None
+    if type(value) is date:
+        return value.isoformat()
+    return None
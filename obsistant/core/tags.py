@@ -3,9 +3,37 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
+from functools import lru_cache
 
 from ..config import Config
 
+_DEFAULT_TAG_REGEX = r"(?<!\w)#([\w/-]+)(?=\s|$)"
+_GRANOLA_LINK_LABEL = "chat with meeting transcript:"
+_DEFAULT_GRANOLA_LINK_REGEX = r"Chat with meeting transcript:\s*\[([^\]]+)\]\([^\)]+\)"
+
+# Patterns used for every processed file, compiled once at import
+_BLANK_LINE_RE = re.compile(r"^\s*$", re.MULTILINE)
+_EXCESS_NEWLINES_RE = re.compile(r"\n{3,}")
+_CODE_FENCE_RE = re.compile(r"^```", re.MULTILINE)
+_MARKDOWN_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^\)]+)\)")
+_QUOTE_RE = re.compile(r'"')
+_PARAGRAPH_GAP_RE = re.compile(r"\n\s*\n\s*\n")
+
+
+@lru_cache(maxsize=32)
+def _compile_pattern(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """Compile a configurable pattern once per distinct pattern string.
+
+    Args:
+        pattern: Regular expression pattern.
+        flags: Regular expression flags.
+
+    Returns:
+        Compiled pattern.
+    """
+    return re.compile(pattern, flags)
+
 
 def extract_tags(body: str, config: Config | None = None) -> tuple[set[str], str]:
     """Extract tags from the content and remove them from the text.
@@ -24,48 +52,164 @@ def extract_tags(body: str, config: Config | None = None) -> tuple[set[str], str
     Returns:
         Tuple of (set of tags, cleaned body text).
     """
-    tag_regex = config.tags.tag_regex if config else r"(?<!\w)#([\w/-]+)(?=\s|$)"
-
-    tags = set()
-    clean_body = body
-
-    # Find all potential tag matches with their positions
-    tag_matches = list(re.finditer(tag_regex, body))
-
-    # Filter out tags that are in excluded contexts
-    valid_tags = []
-    for match in tag_matches:
-        if _is_tag_in_valid_context(body, match.start(), match.end()):
-            valid_tags.append(match)
-            tags.add(match.group(1))
-
-    # Remove valid tags from the body text (in reverse order to maintain positions)
-    for match in reversed(valid_tags):
-        clean_body = clean_body[: match.start()] + clean_body[match.end() :]
+    valid_tags = _find_valid_tags(body, config)
+    tags = {tag for _, _, tag in valid_tags}
+
+    # Keep the text between valid tags and join it once at the end
+    segments = []
+    last_end = 0
+    for start, end, _ in valid_tags:
+        segments.append(body[last_end:start])
+        last_end = end
+    segments.append(body[last_end:])
+    clean_body = "".join(segments)
 
     # Clean up any extra whitespace that might be left, but preserve line structure
     # Remove standalone whitespace on lines where tags were removed
-    clean_body = re.sub(r"^\s*$", "", clean_body, flags=re.MULTILINE)
+    clean_body = _BLANK_LINE_RE.sub("", clean_body)
     # Collapse multiple consecutive empty lines into at most two (preserving paragraph breaks)
-    clean_body = re.sub(r"\n{3,}", "\n\n", clean_body)
+    clean_body = _EXCESS_NEWLINES_RE.sub("\n\n", clean_body)
     # Only strip leading whitespace, preserve trailing whitespace as it indicates where tags were removed
     clean_body = clean_body.lstrip()
     return tags, clean_body
 
 
-def _is_tag_in_valid_context(body: str, start: int, end: int) -> bool:
+def find_tags(body: str, config: Config | None = None) -> set[str]:
+    """Find the tags in the content without removing them.
+
+    Applies the same rules as `extract_tags`, but skips rebuilding the body
+    for callers that only need the tags.
+
+    Args:
+        body: Body content to find tags in.
+        config: Optional configuration object.
+
+    Returns:
+        Set of tags.
+    """
+    return {tag for _, _, tag in _find_valid_tags(body, config)}
+
+
+def _find_valid_tags(
+    body: str, config: Config | None = None
+) -> list[tuple[int, int, str]]:
+    """Find the tags in the content that are not in an excluded context.
+
+    Args:
+        body: Body content to find tags in.
+        config: Optional configuration object.
+
+    Returns:
+        List of (start, end, tag) tuples in order of position.
+    """
+    tag_regex = config.tags.tag_regex if config else _DEFAULT_TAG_REGEX
+
+    # Find all potential tag matches with their positions
+    if tag_regex == _DEFAULT_TAG_REGEX:
+        tag_matches = _scan_default_tags(body)
+    else:
+        tag_matches = [
+            (match.start(), match.end(), match.group(1))
+            for match in _compile_pattern(tag_regex).finditer(body)
+        ]
+    if not tag_matches:
+        return []
+
+    # Filter out tags that are in excluded contexts. Code fences and HTML
+    # comments are located once up front so each check is a binary search
+    # rather than a rescan of the body before the tag.
+    fence_starts = [m.start() for m in _CODE_FENCE_RE.finditer(body)]
+    comments = _find_html_comments(body)
+    return [
+        (start, end, tag)
+        for start, end, tag in tag_matches
+        if _is_tag_in_valid_context(body, start, end, fence_starts, comments)
+    ]
+
+
+def _scan_default_tags(body: str) -> list[tuple[int, int, str]]:
+    """Find tag candidates matching the default tag regex without using `re`.
+
+    Equivalent to ``re.finditer(_DEFAULT_TAG_REGEX, body)``: a ``#`` not preceded
+    by a word character, followed by word characters, ``/`` or ``-``, and then
+    whitespace or the end of the text. Jumps between ``#`` characters with
+    ``str.find`` so text without hashes is skipped at C speed.
+
+    Args:
+        body: Body content to scan.
+
+    Returns:
+        List of (start, end, tag) tuples for each candidate tag.
+    """
+    matches = []
+    length = len(body)
+    pos = body.find("#")
+    while pos != -1:
+        if pos > 0 and _is_word_char(body[pos - 1]):
+            pos = body.find("#", pos + 1)
+            continue
+        end = pos + 1
+        while end < length and (_is_word_char(body[end]) or body[end] in "/-"):
+            end += 1
+        if end > pos + 1 and (end == length or body[end].isspace()):
+            matches.append((pos, end, body[pos + 1 : end]))
+        pos = body.find("#", end)
+    return matches
+
+
+def _is_word_char(char: str) -> bool:
+    """Check if a character matches the regex ``\\w`` class.
+
+    Args:
+        char: Single character to check.
+
+    Returns:
+        True if the character is alphanumeric or an underscore.
+    """
+    return char.isalnum() or char == "_"
+
+
+def _find_html_comments(body: str) -> tuple[list[int], list[int]]:
+    """Locate HTML comments in the body.
+
+    Args:
+        body: Body content.
+
+    Returns:
+        Tuple of (sorted comment start positions, matching end positions), where
+        an end of -1 means the comment is never closed.
+    """
+    starts = []
+    ends = []
+    pos = body.find("<!--")
+    while pos != -1:
+        starts.append(pos)
+        ends.append(body.find("-->", pos))
+        pos = body.find("<!--", pos + 1)
+    return starts, ends
+
+
+def _is_tag_in_valid_context(
+    body: str,
+    start: int,
+    end: int,
+    fence_starts: list[int],
+    comments: tuple[list[int], list[int]],
+) -> bool:
     """Determine if a found tag is in a context where it should be ignored.
 
     Args:
         body: Body content.
         start: Start position of the tag.
         end: End position of the tag.
+        fence_starts: Sorted positions of code fence markers in the body.
+        comments: HTML comment starts and ends, as from `_find_html_comments`.
 
     Returns:
         True if tag should be extracted, False if it should be ignored.
     """
     # Check for code blocks (fenced code blocks)
-    if _is_in_code_block(body, start):
+    if _is_in_code_block(fence_starts, start):
         return False
 
     # Check for inline code (backticks)
@@ -73,7 +217,7 @@ def _is_tag_in_valid_context(body: str, start: int, end: int) -> bool:
         return False
 
     # Check for HTML comments
-    if _is_in_html_comment(body, start):
+    if _is_in_html_comment(comments, start):
         return False
 
     # Check for markdown links
@@ -87,23 +231,19 @@ def _is_tag_in_valid_context(body: str, start: int, end: int) -> bool:
     return True
 
 
-def _is_in_code_block(body: str, pos: int) -> bool:
+def _is_in_code_block(fence_starts: list[int], pos: int) -> bool:
     """Check if position is inside a fenced code block.
 
     Args:
-        body: Body content.
+        fence_starts: Sorted positions of code fence markers in the body.
         pos: Position to check.
 
     Returns:
         True if position is inside a code block.
     """
-    # Count how many ``` we've seen before this position
-    code_block_markers = [
-        m.start() for m in re.finditer(r"^```", body[:pos], re.MULTILINE)
-    ]
-
-    # If we have odd number of markers, we're in a code block
-    return len(code_block_markers) % 2 == 1
+    # Count how many ``` markers end before this position; if we have an odd
+    # number of markers, we're in a code block
+    return bisect_right(fence_starts, pos - 3) % 2 == 1
 
 
 def _is_in_inline_code(body: str, start: int, end: int) -> bool:
@@ -135,25 +275,24 @@ def _is_in_inline_code(body: str, start: int, end: int) -> bool:
     return backticks_before % 2 == 1 and backticks_after > 0
 
 
-def _is_in_html_comment(body: str, pos: int) -> bool:
+def _is_in_html_comment(comments: tuple[list[int], list[int]], pos: int) -> bool:
     """Check if position is inside an HTML comment.
 
     Args:
-        body: Body content.
+        comments: HTML comment starts and ends, as from `_find_html_comments`.
         pos: Position to check.
 
     Returns:
         True if position is inside an HTML comment.
     """
-    # Find the last comment start before this position
-    last_comment_start = body.rfind("<!--", 0, pos)
-    if last_comment_start == -1:
+    # Find the last comment that starts before this position
+    starts, ends = comments
+    index = bisect_right(starts, pos - 4) - 1
+    if index < 0:
         return False
 
-    # Find the corresponding comment end
-    comment_end = body.find("-->", last_comment_start)
-
     # If there's no end, or the end is after our position, we're in a comment
+    comment_end = ends[index]
     return comment_end == -1 or comment_end > pos
 
 
@@ -180,7 +319,7 @@ def _is_in_markdown_link(body: str, pos: int) -> bool:
     pos_in_line = pos - line_start
 
     # Look for link patterns that contain our position
-    for match in re.finditer(r"\[([^\]]+)\]\(([^\)]+)\)", line):
+    for match in _MARKDOWN_LINK_RE.finditer(line):
         if match.start() <= pos_in_line < match.end():
             return True
 
@@ -209,7 +348,7 @@ def _is_in_quoted_string(body: str, start: int, end: int) -> bool:
     tag_end_in_line = end - line_start
 
     # Check for double quotes
-    quote_positions = [m.start() for m in re.finditer(r'"', line)]
+    quote_positions = [m.start() for m in _QUOTE_RE.finditer(line)]
 
     # Count how many quotes come before the tag
     quotes_before = sum(1 for pos in quote_positions if pos < tag_start_in_line)
@@ -232,21 +371,28 @@ def extract_granola_link(
     Returns:
         Tuple of (URL string or None, cleaned body text).
     """
-    link_pattern = (
-        config.granola.link_pattern
-        if config
-        else r"Chat with meeting transcript:\s*\[([^\]]+)\]\([^\)]+\)"
-    )
+    link_regex = config.granola.link_pattern if config else _DEFAULT_GRANOLA_LINK_REGEX
+
+    # Most notes have no transcript link. For the default pattern, rule that
+    # out with a plain substring search; lowercasing only mirrors the regex's
+    # case-insensitive matching exactly for ASCII text, so others use the regex.
+    if (
+        link_regex == _DEFAULT_GRANOLA_LINK_REGEX
+        and body.isascii()
+        and _GRANOLA_LINK_LABEL not in body.lower()
+    ):
+        return None, body
 
-    match = re.search(link_pattern, body, re.IGNORECASE)
+    link_pattern = _compile_pattern(link_regex, re.IGNORECASE)
+    match = link_pattern.search(body)
 
     if match:
         url = match.group(1)  # Extract the URL from the markdown link
         # Remove the entire "Chat with meeting transcript: [URL](URL)" text
-        clean_body = re.sub(link_pattern, "", body, flags=re.IGNORECASE)
+        clean_body = link_pattern.sub("", body)
         # Clean up any extra whitespace and empty lines
-        clean_body = re.sub(r"\n\s*\n\s*\n", "\n\n", clean_body)
-        clean_body = re.sub(r"^\s*$", "", clean_body, flags=re.MULTILINE)
+        clean_body = _PARAGRAPH_GAP_RE.sub("\n\n", clean_body)
+        clean_body = _BLANK_LINE_RE.sub("", clean_body)
         return url, clean_body.strip()
 
     return None, body
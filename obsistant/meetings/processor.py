@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -16,6 +17,10 @@ from ..utils import console
 if TYPE_CHECKING:
     from typing import Any
 
+# YYMMDD_ date prefix at the beginning of a meeting filename
+_DATE_PREFIX_RE = re.compile(r"^(\d{6})_")
+_REPEATED_UNDERSCORES_RE = re.compile(r"_{2,}")
+
 
 def process_meetings_folder(
     vault_root: Path,
@@ -192,10 +197,9 @@ def _generate_meeting_filename(
         # Parse date and format as YYMMDD
         try:
             if isinstance(date_str, str):
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d")
+                date_prefix = _yymmdd(date_str)
             else:
-                date_obj = date_str
-            date_prefix = date_obj.strftime("%y%m%d")
+                date_prefix = date_str.strftime("%y%m%d")
         except (ValueError, AttributeError):
             return None
 
@@ -204,7 +208,7 @@ def _generate_meeting_filename(
 
         # Remove any existing date prefix pattern from title
         # Pattern: YYMMDD_ at the beginning
-        title = re.sub(r"^\d{6}_", "", title)
+        title = _DATE_PREFIX_RE.sub("", title)
 
         # Clean up title - remove any leading/trailing underscores or hyphens
         title = title.strip("_-")
@@ -213,7 +217,7 @@ def _generate_meeting_filename(
         new_filename = f"{date_prefix}_{title}.md"
 
         # Clean up any double underscores or other artifacts
-        new_filename = re.sub(r"_{2,}", "_", new_filename)
+        new_filename = _REPEATED_UNDERSCORES_RE.sub("_", new_filename)
 
         return new_filename
 
@@ -221,6 +225,24 @@ def _generate_meeting_filename(
         return None
 
 
+@lru_cache(maxsize=4096)
+def _yymmdd(date_str: str) -> str:
+    """Convert a YYYY-MM-DD date string to the YYMMDD filename prefix.
+
+    Meeting notes share a small set of dates, so conversions are memoized.
+
+    Args:
+        date_str: Date string in ISO format.
+
+    Returns:
+        Date string in YYMMDD format.
+
+    Raises:
+        ValueError: If the date string is not in YYYY-MM-DD format.
+    """
+    return datetime.strptime(date_str, "%Y-%m-%d").strftime("%y%m%d")
+
+
 def _calculate_archive_cutoff_date(archive_weeks: int = 2) -> datetime:
     """Calculate the cutoff date for archiving meetings.
 
@@ -268,7 +290,7 @@ def _extract_meeting_date(
 
     # Try to extract date from filename (YYMMDD format)
     filename = file_path.stem
-    date_match = re.match(r"^(\d{6})_", filename)
+    date_match = _DATE_PREFIX_RE.match(filename)
     if date_match:
         date_str = date_match.group(1)
         try:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -33,11 +34,37 @@ def _find_target_folder_for_tags(
     )
     ignored_tags = config.tags.ignored_tags if config else ["olt"]
 
+    return _find_target_folder_cached(
+        tuple(tags), tuple(target_tags), tuple(ignored_tags)
+    )
+
+
+@lru_cache(maxsize=1024)
+def _find_target_folder_cached(
+    tags: tuple[str, ...],
+    target_tags: tuple[str, ...],
+    ignored_tags: tuple[str, ...],
+) -> str | None:
+    """Cached lookup behind `_find_target_folder_for_tags`.
+
+    Notes across a vault share a small set of tag combinations, so the
+    folder match is memoized on the hashable tuple form of its inputs.
+
+    Args:
+        tags: Tuple of tag strings from frontmatter.
+        target_tags: Tuple of target tags that map to folders.
+        ignored_tags: Tuple of tags to skip.
+
+    Returns:
+        Target folder name or None if no match found.
+    """
+    ignored = {ignored.lower() for ignored in ignored_tags}
+
     for tag in tags:
         tag_lower = tag.lower()
 
         # Skip ignored tags
-        if tag_lower in [ignored.lower() for ignored in ignored_tags]:
+        if tag_lower in ignored:
             continue
 
         # Check if this tag matches any of our target tags or is a subtag
@@ -121,7 +148,10 @@ def _move_file_to_folder(
 
     # Move the file
     if not dry_run:
-        # Create backup before moving
+        # Create backup before moving. The backup is written from the content
+        # already in memory rather than hardlinked: a hardlink would share the
+        # inode with the moved note, so any later in-place edit would silently
+        # rewrite the backup as well.
         backup_path = create_backup_path(vault_root, file_path, backup_ext)
         backup_path.parent.mkdir(parents=True, exist_ok=True)
         backup_path.write_text(file_content, encoding="utf-8")
@@ -3,12 +3,23 @@
 from __future__ import annotations
 
 from pathlib import Path
+from weakref import WeakKeyDictionary
 
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams
+from qdrant_client.models import (
+    Distance,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    VectorParams,
+)
 
 from .server import is_qdrant_running
 
+# Collections each client has already confirmed or created, so repeated
+# ensure_collection calls skip the collection_exists round-trip
+_known_collections: WeakKeyDictionary[QdrantClient, set[str]] = WeakKeyDictionary()
+
 
 def get_qdrant_client(
     vault_path: Path, url: str = "http://localhost:6333"
@@ -49,6 +60,7 @@ def ensure_collection(
     collection_name: str,
     vector_size: int = 3072,
     recreate: bool = False,
+    quantize: bool = True,
 ) -> None:
     """Ensure a Qdrant collection exists with the specified configuration.
 
@@ -57,10 +69,16 @@ def ensure_collection(
         collection_name: Name of the collection.
         vector_size: Size of the embedding vectors. Defaults to 3072 (OpenAI text-embedding-3-large).
         recreate: If True, delete existing collection before creating.
+        quantize: If True, keep an int8 scalar-quantized copy of the vectors in
+            RAM for searching, which takes a quarter of the float32 memory.
 
     Raises:
         RuntimeError: If collection creation fails.
     """
+    known = _known_collections.setdefault(client, set())
+    if not recreate and collection_name in known:
+        return
+
     if recreate and client.collection_exists(collection_name):
         try:
             client.delete_collection(collection_name)
@@ -68,14 +86,25 @@ def ensure_collection(
             raise RuntimeError(
                 f"Failed to delete existing collection '{collection_name}': {e}"
             ) from e
+        known.discard(collection_name)
 
     if not client.collection_exists(collection_name):
+        quantization_config = (
+            ScalarQuantization(
+                scalar=ScalarQuantizationConfig(type=ScalarType.INT8, always_ram=True)
+            )
+            if quantize
+            else None
+        )
         try:
             client.create_collection(
                 collection_name=collection_name,
                 vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE),
+                quantization_config=quantization_config,
             )
         except Exception as e:
             raise RuntimeError(
                 f"Failed to create collection '{collection_name}': {e}"
             ) from e
+
+    known.add(collection_name)
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
 import time
 import uuid
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Any, TypedDict, cast
 from uuid import UUID
@@ -17,9 +23,10 @@ from qdrant_client.models import FieldCondition, Filter, MatchValue, PointStruct
 from sentence_transformers import SentenceTransformer
 
 from ..config import Config
-from ..core.dates import get_file_creation_date, get_file_modification_date
+from ..core.dates import get_file_dates, get_file_modification_date
+from ..core.file_processing import walk_markdown_files
 from ..core.frontmatter import split_frontmatter
-from ..core.tags import extract_tags
+from ..core.tags import find_tags
 
 
 class IngestStats(TypedDict):
@@ -32,20 +39,24 @@ class IngestStats(TypedDict):
     errors: list[str]
 
 
-# Cache for SentenceTransformer model
-_chunking_model: SentenceTransformer | None = None
+# Worker threads for reading and parsing markdown files (I/O bound)
+_PARSE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
+# Files parsed ahead of the consumer, so a slow embedding step does not let
+# the whole vault pile up in memory
+_PARSE_READ_AHEAD = _PARSE_WORKERS * 2
 
+
+@lru_cache(maxsize=1)
 def _get_chunking_model() -> SentenceTransformer:
     """Get or create the SentenceTransformer model for semantic chunking.
 
+    The model is loaded once per process and shared by every call.
+
     Returns:
         Cached SentenceTransformer model instance.
     """
-    global _chunking_model
-    if _chunking_model is None:
-        _chunking_model = SentenceTransformer("all-MiniLM-L6-v2")
-    return _chunking_model
+    return SentenceTransformer("all-MiniLM-L6-v2")
 
 
 def collect_markdown_files(vault_path: Path, config: Config) -> list[Path]:
@@ -64,22 +75,19 @@ def collect_markdown_files(vault_path: Path, config: Config) -> list[Path]:
 
     # Collect from notes folder
     notes_path = vault_path / config.vault.notes
-    if notes_path.exists() and notes_path.is_dir():
-        for md_file in notes_path.rglob("*.md"):
-            files.append(md_file.resolve())
+    if notes_path.is_dir():
+        files.extend(md_file.resolve() for md_file in walk_markdown_files(notes_path))
 
-    # Collect from meetings folder, excluding Weekly Summaries
+    # Collect from meetings folder, pruning Weekly Summaries without walking it
     meetings_path = vault_path / config.vault.meetings
-    if meetings_path.exists() and meetings_path.is_dir():
+    if meetings_path.is_dir():
         weekly_summaries_path = meetings_path / "Weekly Summaries"
-        for md_file in meetings_path.rglob("*.md"):
-            # Skip files in Weekly Summaries folder
-            try:
-                md_file.resolve().relative_to(weekly_summaries_path.resolve())
-                continue
-            except ValueError:
-                # File is not in Weekly Summaries, include it
-                files.append(md_file.resolve())
+        files.extend(
+            md_file.resolve()
+            for md_file in walk_markdown_files(
+                meetings_path, exclude={weekly_summaries_path}
+            )
+        )
 
     return files
 
@@ -110,7 +118,7 @@ def parse_markdown_file(
     frontmatter, body = split_frontmatter(text)
 
     # Extract tags from body
-    body_tags, _ = extract_tags(body, config)
+    body_tags = find_tags(body, config)
 
     # Merge tags from frontmatter and body
     frontmatter_tags = set(frontmatter.get("tags", [])) if frontmatter else set()
@@ -136,15 +144,10 @@ def parse_markdown_file(
         metadata.update(frontmatter)
 
     # Add file dates if not in frontmatter
-    if "created" not in metadata:
-        created_date = get_file_creation_date(file_path)
-        if created_date:
-            metadata["created"] = created_date
-
-    if "modified" not in metadata:
-        modified_date = get_file_modification_date(file_path)
-        if modified_date:
-            metadata["modified"] = modified_date
+    if "created" not in metadata or "modified" not in metadata:
+        created_date, modified_date = get_file_dates(file_path)
+        metadata.setdefault("created", created_date)
+        metadata.setdefault("modified", modified_date)
 
     # Add title from frontmatter or filename
     metadata["title"] = metadata.get("title") or file_path.stem
@@ -156,6 +159,44 @@ def parse_markdown_file(
     }
 
 
+def parse_markdown_files(
+    file_paths: list[Path], vault_path: Path, config: Config
+) -> Iterator[dict[str, Any] | Exception]:
+    """Parse markdown files concurrently, yielding results in input order.
+
+    Reading and parsing is I/O bound, so files are handled in a thread pool
+    while the caller chunks and embeds the ones already parsed. At most
+    `_PARSE_READ_AHEAD` files are in flight or waiting to be consumed.
+
+    Args:
+        file_paths: Paths to the markdown files.
+        vault_path: Path to the vault root directory.
+        config: Configuration object.
+
+    Yields:
+        Parsed file dictionary as returned by `parse_markdown_file`, or the
+        exception raised while parsing that file.
+    """
+
+    def parse_one(file_path: Path) -> dict[str, Any] | Exception:
+        try:
+            return parse_markdown_file(file_path, vault_path, config)
+        except Exception as e:
+            return e
+
+    paths = iter(file_paths)
+    with ThreadPoolExecutor(max_workers=_PARSE_WORKERS) as executor:
+        pending: deque[Future[dict[str, Any] | Exception]] = deque(
+            executor.submit(parse_one, path)
+            for path in islice(paths, _PARSE_READ_AHEAD)
+        )
+        while pending:
+            result = pending.popleft().result()
+            for path in islice(paths, 1):
+                pending.append(executor.submit(parse_one, path))
+            yield result
+
+
 def parse_pdf_file(file_path: Path, vault_path: Path) -> dict[str, Any]:
     """Parse a PDF file and extract text content.
 
@@ -230,42 +271,39 @@ def semantic_chunk(text: str, similarity_threshold: float = 0.5) -> list[str]:
     if not sentences:
         return [text] if text.strip() else []
 
-    # Encode sentences
+    # Encode all sentences in batched forward passes, as unit vectors
     try:
-        embeddings = model.encode(sentences, show_progress_bar=False)
+        embeddings = model.encode(
+            sentences,
+            batch_size=64,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
     except Exception as e:
         logger.warning(f"Failed to encode sentences for chunking: {e}")
         # Fallback: return text as single chunk
         return [text] if text.strip() else []
 
-    # Group sentences by similarity
-    chunks = []
-    current_chunk = [sentences[0]]
+    # Cosine similarity of each sentence with the next, in one vectorized pass
+    embeddings = np.asarray(embeddings)
+    similarities = np.einsum("ij,ij->i", embeddings[:-1], embeddings[1:])
 
-    for i in range(1, len(sentences)):
-        # Calculate cosine similarity
-        similarity = np.dot(embeddings[i - 1], embeddings[i]) / (
-            np.linalg.norm(embeddings[i - 1]) * np.linalg.norm(embeddings[i])
-        )
+    # Start a new chunk wherever similarity drops below the threshold
+    boundaries = np.flatnonzero(similarities < similarity_threshold) + 1
+    starts = [0, *boundaries.tolist()]
+    ends = [*boundaries.tolist(), len(sentences)]
 
-        if similarity < similarity_threshold:
-            chunk_text = " ".join(current_chunk)
-            if chunk_text.strip():
-                chunks.append(chunk_text)
-            current_chunk = [sentences[i]]
-        else:
-            current_chunk.append(sentences[i])
-
-    # Add final chunk
-    if current_chunk:
-        chunk_text = " ".join(current_chunk)
+    chunks = []
+    for start, end in zip(starts, ends, strict=True):
+        chunk_text = " ".join(sentences[start:end])
         if chunk_text.strip():
             chunks.append(chunk_text)
 
     return chunks if chunks else [text] if text.strip() else []
 
 
-def generate_embedding(text: str, client: OpenAI, max_retries: int = 3) -> list[float]:
+def generate_embedding(text: str, client: OpenAI, max_retries: int = 3) -> np.ndarray:
     """Generate embedding for text using OpenAI API.
 
     Args:
@@ -274,7 +312,7 @@ def generate_embedding(text: str, client: OpenAI, max_retries: int = 3) -> list[
         max_retries: Maximum number of retry attempts.
 
     Returns:
-        Embedding vector (3072 dimensions for text-embedding-3-large).
+        Float32 embedding vector (3072 dimensions for text-embedding-3-large).
 
     Raises:
         RuntimeError: If embedding generation fails after retries.
@@ -285,7 +323,7 @@ def generate_embedding(text: str, client: OpenAI, max_retries: int = 3) -> list[
                 input=text,
                 model="text-embedding-3-large",
             )
-            return response.data[0].embedding
+            return np.asarray(response.data[0].embedding, dtype=np.float32)
         except Exception as e:
             if attempt < max_retries - 1:
                 wait_time = 2**attempt  # Exponential backoff
@@ -302,6 +340,53 @@ def generate_embedding(text: str, client: OpenAI, max_retries: int = 3) -> list[
     raise RuntimeError("Failed to generate embedding")  # Should never reach here
 
 
+def generate_embeddings_batch(
+    texts: list[str], client: OpenAI, batch_size: int = 128, max_retries: int = 3
+) -> np.ndarray:
+    """Generate embeddings for several texts with as few API requests as possible.
+
+    Args:
+        texts: Texts to embed.
+        client: OpenAI client instance.
+        batch_size: Maximum number of texts sent in a single request.
+        max_retries: Maximum number of retry attempts per request.
+
+    Returns:
+        Float32 array with one embedding row per text, in the same order.
+
+    Raises:
+        RuntimeError: If embedding generation fails after retries.
+    """
+    batches: list[np.ndarray] = []
+    for start in range(0, len(texts), batch_size):
+        batch = texts[start : start + batch_size]
+        for attempt in range(max_retries):
+            try:
+                response = client.embeddings.create(
+                    input=batch,
+                    model="text-embedding-3-large",
+                )
+                break
+            except Exception as e:
+                if attempt < max_retries - 1:
+                    wait_time = 2**attempt  # Exponential backoff
+                    logger.warning(
+                        f"Embedding generation failed (attempt {attempt + 1}/{max_retries}): {e}. "
+                        f"Retrying in {wait_time}s..."
+                    )
+                    time.sleep(wait_time)
+                else:
+                    raise RuntimeError(
+                        f"Failed to generate embeddings after {max_retries} attempts: {e}"
+                    ) from e
+        batches.append(
+            np.asarray([item.embedding for item in response.data], dtype=np.float32)
+        )
+    if not batches:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.concatenate(batches)
+
+
 def build_payload(
     chunk: str, file_metadata: dict[str, Any], chunk_index: int
 ) -> dict[str, Any]:
@@ -388,6 +473,134 @@ def _file_needs_ingestion(
         return True, []
 
 
+def _chunk_point_ids(file_path: str, chunks: list[str]) -> list[str]:
+    """Derive deterministic Qdrant point IDs for the chunks of a file.
+
+    Each ID hashes the file path, the chunk text and how many identical chunks
+    precede it, so a chunk that survives an edit keeps its ID and its stored
+    vector can be reused instead of embedding it again.
+
+    Args:
+        file_path: Relative file path stored in the payload.
+        chunks: Text chunks of the file, in order.
+
+    Returns:
+        UUID strings, one per chunk.
+    """
+    occurrences: dict[str, int] = {}
+    point_ids = []
+    for chunk in chunks:
+        occurrence = occurrences.get(chunk, 0)
+        occurrences[chunk] = occurrence + 1
+        key = f"{file_path}\0{occurrence}\0{chunk}".encode()
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        point_ids.append(str(uuid.UUID(bytes=digest)))
+    return point_ids
+
+
+def _build_chunk_points(
+    qdrant_client: Any,
+    openai_client: OpenAI,
+    collection_name: str,
+    chunks: list[str],
+    file_metadata: dict[str, Any],
+    existing_point_ids: list[str],
+) -> tuple[list[PointStruct], int]:
+    """Build the Qdrant points for a file, embedding only chunks not yet stored.
+
+    Args:
+        qdrant_client: Qdrant client instance.
+        openai_client: OpenAI client instance.
+        collection_name: Name of the collection.
+        chunks: Text chunks of the file, in order.
+        file_metadata: Metadata dictionary from parsed file.
+        existing_point_ids: IDs of the points currently stored for the file.
+
+    Returns:
+        Tuple of (points to upsert, number of newly generated embeddings).
+
+    Raises:
+        RuntimeError: If embedding generation fails.
+    """
+    file_path = str(file_metadata["file_path"])
+    point_ids = _chunk_point_ids(file_path, chunks)
+
+    # Reuse the stored vectors of chunks that are unchanged since last ingest
+    vectors: dict[str, Any] = {}
+    reusable = set(existing_point_ids).intersection(point_ids)
+    if reusable:
+        try:
+            records = qdrant_client.retrieve(
+                collection_name=collection_name,
+                ids=list(reusable),
+                with_vectors=True,
+            )
+            vectors = {
+                str(record.id): record.vector
+                for record in records
+                if record.vector is not None
+            }
+        except Exception as e:
+            logger.warning(f"Failed to retrieve stored vectors for {file_path}: {e}")
+
+    missing = [idx for idx, point_id in enumerate(point_ids) if point_id not in vectors]
+    if missing:
+        embeddings = generate_embeddings_batch(
+            [chunks[idx] for idx in missing], openai_client
+        )
+        for idx, embedding in zip(missing, embeddings):
+            vectors[point_ids[idx]] = embedding.tolist()
+
+    points = [
+        PointStruct(
+            id=point_id,
+            vector=vectors[point_id],
+            payload=build_payload(chunk, file_metadata, idx),
+        )
+        for idx, (point_id, chunk) in enumerate(zip(point_ids, chunks))
+    ]
+    return points, len(missing)
+
+
+def _delete_stale_points(
+    qdrant_client: Any,
+    collection_name: str,
+    existing_point_ids: list[str],
+    points: list[PointStruct],
+    file_path: Path,
+    logger_instance: Any,
+) -> None:
+    """Delete the stored points of a file that were not upserted again.
+
+    Args:
+        qdrant_client: Qdrant client instance.
+        collection_name: Name of the collection.
+        existing_point_ids: IDs of the points stored before re-ingesting.
+        points: Points just upserted for the file.
+        file_path: Path of the file, for logging.
+        logger_instance: Logger instance for logging.
+    """
+    current_ids = {str(point.id) for point in points}
+    stale_ids = [
+        point_id for point_id in existing_point_ids if point_id not in current_ids
+    ]
+    if not stale_ids:
+        return
+
+    logger_instance.debug(
+        f"File {file_path} has changed, deleting {len(stale_ids)} old chunks"
+    )
+    try:
+        # Cast to satisfy type checker - list[str] is compatible with list[int | str | UUID]
+        point_ids: list[int | str | UUID] = cast(list[int | str | UUID], stale_ids)
+        qdrant_client.delete(
+            collection_name=collection_name,
+            points_selector=PointIdsList(points=point_ids),
+        )
+    except Exception as e:
+        logger_instance.warning(f"Failed to delete old chunks for {file_path}: {e}")
+
+
 def ingest_documents(
     vault_path: Path,
     config: Config,
@@ -464,9 +677,11 @@ def ingest_documents(
         logger_instance.info(f"Found {len(pdf_files)} PDF files")
 
     # Process markdown files
-    for file_path in md_files:
+    parsed_files = parse_markdown_files(md_files, vault_path, config)
+    for file_path, parsed in zip(md_files, parsed_files):
         try:
-            parsed = parse_markdown_file(file_path, vault_path, config)
+            if isinstance(parsed, Exception):
+                raise parsed
             chunks = semantic_chunk(parsed["content"])
 
             if not chunks:
@@ -491,25 +706,6 @@ def ingest_documents(
                     stats["files_skipped"] += 1
                     continue
 
-                # Delete old chunks if file was modified
-                if existing_point_ids:
-                    logger_instance.debug(
-                        f"File {file_path} has changed, deleting {len(existing_point_ids)} old chunks"
-                    )
-                    try:
-                        # Cast to satisfy type checker - list[str] is compatible with list[int | str | UUID]
-                        point_ids: list[int | str | UUID] = cast(
-                            list[int | str | UUID], existing_point_ids
-                        )
-                        qdrant_client.delete(
-                            collection_name=collection_name,
-                            points_selector=PointIdsList(points=point_ids),
-                        )
-                    except Exception as e:
-                        logger_instance.warning(
-                            f"Failed to delete old chunks for {file_path}: {e}"
-                        )
-
             logger_instance.debug(
                 f"Processing {file_path}: {len(chunks)} chunks, "
                 f"tags: {parsed['metadata'].get('tags', [])}"
@@ -520,29 +716,35 @@ def ingest_documents(
                 stats["chunks_created"] += len(chunks)
                 continue
 
-            # Generate embeddings and upsert
-            points = []
-            for idx, chunk in enumerate(chunks):
-                try:
-                    embedding = generate_embedding(chunk, openai_client)
-                    payload = build_payload(chunk, parsed["metadata"], idx)
-                    points.append(
-                        PointStruct(
-                            id=str(uuid.uuid4()),
-                            vector=embedding,
-                            payload=payload,
-                        )
-                    )
-                    stats["embeddings_generated"] += 1
-                except Exception as e:
-                    error_msg = f"Failed to process chunk {idx} of {file_path}: {e}"
-                    logger_instance.error(error_msg)
-                    stats["errors"].append(error_msg)
-
-            if points:
-                qdrant_client.upsert(collection_name=collection_name, points=points)
-                stats["files_processed"] += 1
-                stats["chunks_created"] += len(points)
+            # Embed the chunks in batched requests, reusing the stored vectors of
+            # unchanged chunks, then drop the points of chunks that no longer exist
+            try:
+                points, embedded = _build_chunk_points(
+                    qdrant_client,
+                    openai_client,
+                    collection_name,
+                    chunks,
+                    parsed["metadata"],
+                    existing_point_ids,
+                )
+            except Exception as e:
+                error_msg = f"Failed to embed chunks of {file_path}: {e}"
+                logger_instance.error(error_msg)
+                stats["errors"].append(error_msg)
+                continue
+            stats["embeddings_generated"] += embedded
+
+            qdrant_client.upsert(collection_name=collection_name, points=points)
+            _delete_stale_points(
+                qdrant_client,
+                collection_name,
+                existing_point_ids,
+                points,
+                file_path,
+                logger_instance,
+            )
+            stats["files_processed"] += 1
+            stats["chunks_created"] += len(points)
 
         except Exception as e:
             error_msg = f"Failed to process {file_path}: {e}"
@@ -578,25 +780,6 @@ def ingest_documents(
                         stats["files_skipped"] += 1
                         continue
 
-                    # Delete old chunks if file was modified
-                    if existing_point_ids:
-                        logger_instance.debug(
-                            f"File {file_path} has changed, deleting {len(existing_point_ids)} old chunks"
-                        )
-                        try:
-                            # Cast to satisfy type checker - list[str] is compatible with list[int | str | UUID]
-                            point_ids: list[int | str | UUID] = cast(
-                                list[int | str | UUID], existing_point_ids
-                            )
-                            qdrant_client.delete(
-                                collection_name=collection_name,
-                                points_selector=PointIdsList(points=point_ids),
-                            )
-                        except Exception as e:
-                            logger_instance.warning(
-                                f"Failed to delete old chunks for {file_path}: {e}"
-                            )
-
                 logger_instance.debug(f"Processing {file_path}: {len(chunks)} chunks")
 
                 if dry_run:
@@ -604,29 +787,35 @@ def ingest_documents(
                     stats["chunks_created"] += len(chunks)
                     continue
 
-                # Generate embeddings and upsert
-                points = []
-                for idx, chunk in enumerate(chunks):
-                    try:
-                        embedding = generate_embedding(chunk, openai_client)
-                        payload = build_payload(chunk, parsed["metadata"], idx)
-                        points.append(
-                            PointStruct(
-                                id=str(uuid.uuid4()),
-                                vector=embedding,
-                                payload=payload,
-                            )
-                        )
-                        stats["embeddings_generated"] += 1
-                    except Exception as e:
-                        error_msg = f"Failed to process chunk {idx} of {file_path}: {e}"
-                        logger_instance.error(error_msg)
-                        stats["errors"].append(error_msg)
-
-                if points:
-                    qdrant_client.upsert(collection_name=collection_name, points=points)
-                    stats["files_processed"] += 1
-                    stats["chunks_created"] += len(points)
+                # Embed the chunks in batched requests, reusing the stored vectors of
+                # unchanged chunks, then drop the points of chunks that no longer exist
+                try:
+                    points, embedded = _build_chunk_points(
+                        qdrant_client,
+                        openai_client,
+                        collection_name,
+                        chunks,
+                        parsed["metadata"],
+                        existing_point_ids,
+                    )
+                except Exception as e:
+                    error_msg = f"Failed to embed chunks of {file_path}: {e}"
+                    logger_instance.error(error_msg)
+                    stats["errors"].append(error_msg)
+                    continue
+                stats["embeddings_generated"] += embedded
+
+                qdrant_client.upsert(collection_name=collection_name, points=points)
+                _delete_stale_points(
+                    qdrant_client,
+                    collection_name,
+                    existing_point_ids,
+                    points,
+                    file_path,
+                    logger_instance,
+                )
+                stats["files_processed"] += 1
+                stats["chunks_created"] += len(points)
 
             except Exception as e:
                 error_msg = f"Failed to process {file_path}: {e}"
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import hashlib
+import shutil
 import subprocess
+import time
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple
 
 from loguru import logger
 
+# How long to wait for a started container to report it is running
+_START_TIMEOUT = 60.0
+# First and largest delay between container state polls, in seconds
+_POLL_INITIAL_DELAY = 0.05
+_POLL_MAX_DELAY = 1.6
+
 
 def get_qdrant_storage_path(vault_path: Path) -> Path:
     """Get the Qdrant storage directory path for a vault.
@@ -48,7 +58,19 @@ def _get_container_name(vault_path: Path) -> str:
     Returns:
         Container name string.
     """
-    vault_abs = str(vault_path.resolve())
+    return _container_name_for(str(vault_path.resolve()))
+
+
+@lru_cache(maxsize=256)
+def _container_name_for(vault_abs: str) -> str:
+    """Generate the container name for an absolute vault path.
+
+    Args:
+        vault_abs: Resolved absolute vault path.
+
+    Returns:
+        Container name string.
+    """
     # Create a short hash of the vault path
     hash_obj = hashlib.md5(vault_abs.encode())
     hash_hex = hash_obj.hexdigest()[:8]
@@ -56,86 +78,85 @@ def _get_container_name(vault_path: Path) -> str:
 
 
 def _check_docker_available() -> bool:
-    """Check if Docker is available and running.
+    """Check if the Docker CLI is available.
+
+    Looks the executable up on PATH instead of spawning ``docker --version``;
+    whether the daemon is running surfaces from the first real docker command.
 
     Returns:
         True if Docker is available, False otherwise.
     """
-    try:
-        result = subprocess.run(
-            ["docker", "--version"],
-            capture_output=True,
-            check=True,
-            timeout=5,
-        )
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-        return False
+    return shutil.which("docker") is not None
 
 
-def _check_ports_available(ports: tuple[int, int]) -> bool:
-    """Check if the required ports are available.
+class _Container(NamedTuple):
+    """A container as listed by ``docker ps -a``."""
 
-    Args:
-        ports: Tuple of (http_port, grpc_port).
+    id: str
+    name: str
+    running: bool
+    ports: str
+
+
+def _list_containers() -> list[_Container]:
+    """List all Docker containers with a single ``docker ps -a`` call.
+
+    Starting the server needs to know whether its container is running, stopped
+    or missing, and which host ports are published. One snapshot answers all of
+    these instead of a separate ``docker ps`` per question.
 
     Returns:
-        True if ports appear available, False otherwise.
+        Containers known to Docker, empty if Docker cannot be queried.
     """
-    http_port, grpc_port = ports
     try:
-        # Check if ports are in use by checking docker containers
         result = subprocess.run(
             [
                 "docker",
                 "ps",
+                "-a",
                 "--format",
-                "{{.Ports}}",
+                "{{.ID}}\t{{.Names}}\t{{.Status}}\t{{.Ports}}",
             ],
             capture_output=True,
             check=True,
             text=True,
             timeout=5,
         )
-        ports_output = result.stdout
-        return (
-            f":{http_port}->" not in ports_output
-            and f":{grpc_port}->" not in ports_output
-        )
     except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-        # If we can't check, assume available (will fail later if not)
-        return True
+        return []
+
+    containers = []
+    for line in result.stdout.splitlines():
+        fields = line.split("\t")
+        if len(fields) < 3:
+            continue
+        container_id, name, status = fields[:3]
+        ports = fields[3] if len(fields) > 3 else ""
+        containers.append(
+            _Container(container_id, name, status.startswith("Up"), ports)
+        )
+    return containers
 
 
-def _container_exists(vault_path: Path) -> bool:
-    """Check if Qdrant container exists (running or stopped).
+def _check_ports_available(
+    ports: tuple[int, int], containers: list[_Container]
+) -> bool:
+    """Check if the required ports are available.
 
     Args:
-        vault_path: Path to the vault root directory.
+        ports: Tuple of (http_port, grpc_port).
+        containers: Containers from `_list_containers`.
 
     Returns:
-        True if container exists, False otherwise.
+        True if ports appear available, False otherwise.
     """
-    container_name = _get_container_name(vault_path)
-    try:
-        result = subprocess.run(
-            [
-                "docker",
-                "ps",
-                "-a",
-                "--filter",
-                f"name={container_name}",
-                "--format",
-                "{{.Names}}",
-            ],
-            capture_output=True,
-            check=True,
-            text=True,
-            timeout=5,
-        )
-        return container_name in result.stdout
-    except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-        return False
+    http_port, grpc_port = ports
+    # If Docker could not be queried the list is empty: assume available
+    # (docker run will fail later if not)
+    ports_output = " ".join(container.ports for container in containers)
+    return (
+        f":{http_port}->" not in ports_output and f":{grpc_port}->" not in ports_output
+    )
 
 
 def is_qdrant_running(vault_path: Path) -> bool:
@@ -168,6 +189,69 @@ def is_qdrant_running(vault_path: Path) -> bool:
         return False
 
 
+def _wait_for_container(container_name: str, timeout: float = _START_TIMEOUT) -> str:
+    """Wait for a started container to be running and return its ID.
+
+    Polls ``docker inspect`` with exponential backoff. A container with a
+    healthcheck must also report healthy; one that exits, dies or turns
+    unhealthy fails immediately instead of waiting out the timeout.
+
+    Args:
+        container_name: Name of the container.
+        timeout: Maximum number of seconds to wait.
+
+    Returns:
+        Container ID.
+
+    Raises:
+        RuntimeError: If the container stops, is unhealthy, cannot be
+            inspected, or is not ready within the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    delay = _POLL_INITIAL_DELAY
+    while True:
+        try:
+            result = subprocess.run(
+                [
+                    "docker",
+                    "inspect",
+                    "--format",
+                    "{{.Id}} {{.State.Status}} "
+                    "{{if .State.Health}}{{.State.Health.Status}}{{end}}",
+                    container_name,
+                ],
+                capture_output=True,
+                check=True,
+                text=True,
+                timeout=5,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            raise RuntimeError(
+                f"Failed to check the state of container '{container_name}'"
+            ) from e
+
+        # Incomplete output is treated as not ready yet and polled again
+        fields = result.stdout.split()
+        if len(fields) >= 2:
+            container_id, status, *health = fields
+            health_status = health[0] if health else None
+            if status == "running" and health_status in (None, "healthy"):
+                return container_id
+            if status not in ("created", "restarting", "running") or (
+                health_status == "unhealthy"
+            ):
+                raise RuntimeError(
+                    f"Container '{container_name}' failed to start "
+                    f"(status: {health_status or status})"
+                )
+        if time.monotonic() + delay > deadline:
+            raise RuntimeError(
+                f"Container '{container_name}' was not ready after {timeout:.0f}s"
+            )
+        time.sleep(delay)
+        delay = min(delay * 2, _POLL_MAX_DELAY)
+
+
 def start_qdrant_server(vault_path: Path, ports: tuple[int, int] = (6333, 6334)) -> str:
     """Start Qdrant server in Docker for the given vault.
 
@@ -190,32 +274,16 @@ def start_qdrant_server(vault_path: Path, ports: tuple[int, int] = (6333, 6334))
     container_name = _get_container_name(vault_path)
     http_port, grpc_port = ports
 
-    # Check if container is already running
-    if is_qdrant_running(vault_path):
+    # One snapshot tells whether the container is running, stopped or missing
+    containers = _list_containers()
+    container = next((c for c in containers if c.name == container_name), None)
+    if container is not None and container.running:
         logger.info(f"Qdrant server is already running in container '{container_name}'")
         logger.info(f"Dashboard: http://localhost:{http_port}/dashboard")
-        # Get container ID
-        try:
-            result = subprocess.run(
-                [
-                    "docker",
-                    "ps",
-                    "--filter",
-                    f"name={container_name}",
-                    "--format",
-                    "{{.ID}}",
-                ],
-                capture_output=True,
-                check=True,
-                text=True,
-                timeout=5,
-            )
-            return result.stdout.strip()
-        except subprocess.SubprocessError:
-            return container_name
+        return container.id
 
     # Check if container exists but is stopped
-    if _container_exists(vault_path):
+    if container is not None:
         logger.info(
             f"Container '{container_name}' exists but is stopped. Starting it..."
         )
@@ -226,24 +294,10 @@ def start_qdrant_server(vault_path: Path, ports: tuple[int, int] = (6333, 6334))
                 capture_output=True,
                 timeout=30,
             )
+            container_id = _wait_for_container(container_name)
             logger.info(f"Started existing container '{container_name}'")
             logger.info(f"Dashboard: http://localhost:{http_port}/dashboard")
-            # Get container ID
-            result = subprocess.run(
-                [
-                    "docker",
-                    "ps",
-                    "--filter",
-                    f"name={container_name}",
-                    "--format",
-                    "{{.ID}}",
-                ],
-                capture_output=True,
-                check=True,
-                text=True,
-                timeout=5,
-            )
-            return result.stdout.strip()
+            return container_id
         except subprocess.CalledProcessError as start_error:
             error_msg = (
                 start_error.stderr.strip() if start_error.stderr else "Unknown error"
@@ -263,7 +317,7 @@ def start_qdrant_server(vault_path: Path, ports: tuple[int, int] = (6333, 6334))
     storage_abs = str(storage_path.resolve())
 
     # Check if ports are available (warning only)
-    if not _check_ports_available(ports):
+    if not _check_ports_available(ports, containers):
         logger.warning(
             f"Ports {http_port} or {grpc_port} may already be in use. "
             "Starting anyway - Docker will fail if ports are unavailable."
@@ -291,14 +345,14 @@ def start_qdrant_server(vault_path: Path, ports: tuple[int, int] = (6333, 6334))
         logger.debug(f"Container name: {container_name}")
         logger.debug(f"Ports: HTTP {http_port}, gRPC {grpc_port}")
 
-        result = subprocess.run(
+        subprocess.run(
             cmd,
             capture_output=True,
             check=True,
             text=True,
             timeout=30,
         )
-        container_id = result.stdout.strip()
+        container_id = _wait_for_container(container_name)
         logger.info(f"Qdrant server started successfully. Container ID: {container_id}")
         logger.info(f"HTTP API: http://localhost:{http_port}")
         logger.info(f"gRPC API: localhost:{grpc_port}")
@@ -323,23 +377,9 @@ def start_qdrant_server(vault_path: Path, ports: tuple[int, int] = (6333, 6334))
                     capture_output=True,
                     timeout=10,
                 )
+                container_id = _wait_for_container(container_name)
                 logger.info(f"Started existing container '{container_name}'")
-                # Get container ID
-                result = subprocess.run(
-                    [
-                        "docker",
-                        "ps",
-                        "--filter",
-                        f"name={container_name}",
-                        "--format",
-                        "{{.ID}}",
-                    ],
-                    capture_output=True,
-                    check=True,
-                    text=True,
-                    timeout=5,
-                )
-                return result.stdout.strip()
+                return container_id
             except subprocess.SubprocessError as start_error:
                 raise RuntimeError(
                     f"Failed to start existing container '{container_name}'. "
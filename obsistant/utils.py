@@ -5,13 +5,21 @@ from __future__ import annotations
 from pathlib import Path
 
 from rich.console import Console
+from rich.text import Text
 
 console = Console()
 
 
-def log_change(file: Path, added: set[str], removed: set[str], dry: bool) -> None:
-    """Log changes made to a file using rich console formatting."""
+def log_change(file: Path, n_added: int, n_removed: int, dry: bool) -> None:
+    """Log changes made to a file using rich console formatting.
+
+    The line is assembled as styled `Text` rather than markup, so it skips
+    Rich's markup parser and brackets in file names are printed literally.
+    """
     console.print(
-        f"[bold cyan]{file}[/]: +{len(added)} tags, "
-        f"-{len(removed)} tags {'[dry-run]' if dry else ''}"
+        Text.assemble(
+            (str(file), "bold cyan"),
+            f": +{n_added} tags, -{n_removed} tags ",
+            "[dry-run]" if dry else "",
+        )
     )
@@ -0,0 +1,118 @@
+"""Processing cache for vault-wide runs.
+
+Stores the size and modification time of every note after `process_vault`
+has handled it, so re-running on a mostly unchanged vault skips the files
+that have not been touched since.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from .. import __version__
+from ..config import Config
+
+CACHE_VERSION = 1
+
+
+def get_cache_path(vault_root: Path) -> Path:
+    """Get the path of the processing cache file for a vault.
+
+    Args:
+        vault_root: Root directory of the vault.
+
+    Returns:
+        Path to the cache file inside the .obsistant folder.
+    """
+    return vault_root / ".obsistant" / "process-cache.json"
+
+
+def cache_fingerprint(format_md: bool, config: Config | None) -> str:
+    """Fingerprint the options that affect how a file is processed.
+
+    A cache written with different options (or by a different obsistant
+    version) is discarded, since its entries no longer prove a file is done.
+
+    Args:
+        format_md: Whether markdown formatting is enabled.
+        config: Optional configuration object.
+
+    Returns:
+        Hex digest identifying the processing options.
+    """
+    options = {
+        "version": __version__,
+        "format_md": format_md,
+        "config": config.model_dump(mode="json") if config else None,
+    }
+    payload = json.dumps(options, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()
+
+
+def file_signature(path: Path) -> tuple[int, int] | None:
+    """Get the (mtime_ns, size) signature of a file.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Tuple of modification time in nanoseconds and size, or None on error.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_process_cache(vault_root: Path, fingerprint: str) -> dict[str, list[int]]:
+    """Load cached file signatures for a vault.
+
+    Args:
+        vault_root: Root directory of the vault.
+        fingerprint: Fingerprint of the current processing options.
+
+    Returns:
+        Mapping of vault-relative paths to [mtime_ns, size], empty if the cache
+        is missing, unreadable, or was written with different options.
+    """
+    try:
+        data = json.loads(get_cache_path(vault_root).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(data, dict)
+        or data.get("cache_version") != CACHE_VERSION
+        or data.get("fingerprint") != fingerprint
+        or not isinstance(data.get("files"), dict)
+    ):
+        return {}
+    return data["files"]
+
+
+def save_process_cache(
+    vault_root: Path, fingerprint: str, files: dict[str, list[int]]
+) -> None:
+    """Save file signatures for a vault.
+
+    Failures are ignored: the cache only saves work and is rebuilt next run.
+
+    Args:
+        vault_root: Root directory of the vault.
+        fingerprint: Fingerprint of the current processing options.
+        files: Mapping of vault-relative paths to [mtime_ns, size].
+    """
+    cache_path = get_cache_path(vault_root)
+    data = {
+        "cache_version": CACHE_VERSION,
+        "fingerprint": fingerprint,
+        "files": files,
+    }
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(data), encoding="utf-8")
+    except OSError:
+        pass
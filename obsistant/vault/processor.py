@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ..config import Config
 from ..core import process_file, walk_markdown_files
 from ..utils import console
+from .cache import (
+    cache_fingerprint,
+    file_signature,
+    load_process_cache,
+    save_process_cache,
+)
 
 if TYPE_CHECKING:
     from typing import Any
 
+# Worker threads for vault-wide processing (I/O bound, so more than cores)
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
 def process_vault(
     root: str,
@@ -49,21 +60,49 @@ def process_vault(
         if stats["processed"]:
             total_processed_files += 1
     else:
-        # Process all markdown files in the vault
-        for markdown_file in walk_markdown_files(vault_root):
+        # Process all markdown files in the vault. Files are independent and
+        # processing is dominated by file I/O, so overlap them in a thread pool.
+        # Files whose (mtime, size) match the last run's cache are skipped.
+        fingerprint = cache_fingerprint(format_md, config)
+        cached = load_process_cache(vault_root, fingerprint)
+        seen: dict[str, list[int]] = {}
+
+        def process_one(
+            file_path: Path,
+        ) -> tuple[str, tuple[int, int] | None, dict[str, Any]]:
+            key = file_path.relative_to(vault_root).as_posix()
+            signature = file_signature(file_path)
+            if signature is not None and cached.get(key) == list(signature):
+                return (
+                    key,
+                    signature,
+                    {
+                        "added_tags": 0,
+                        "removed_tags": 0,
+                        "processed": False,
+                        "error": False,
+                    },
+                )
             stats = process_file(
-                markdown_file,
-                vault_root,
-                dry_run,
-                backup_ext,
-                logger,
-                format_md,
-                config,
+                file_path, vault_root, dry_run, backup_ext, logger, format_md, config
             )
-            total_added_tags += stats["added_tags"]
-            total_removed_tags += stats["removed_tags"]
-            if stats["processed"]:
-                total_processed_files += 1
+            # Files that failed to read or write are retried on the next run
+            if stats["error"]:
+                return key, None, stats
+            return key, file_signature(file_path), stats
+
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            results = executor.map(process_one, walk_markdown_files(vault_root))
+            for key, signature, stats in results:
+                if signature is not None:
+                    seen[key] = list(signature)
+                total_added_tags += stats["added_tags"]
+                total_removed_tags += stats["removed_tags"]
+                if stats["processed"]:
+                    total_processed_files += 1
+
+        if not dry_run:
+            save_process_cache(vault_root, fingerprint, seen)
 
     # Print summary statistics using rich
     if specific_file:
@@ -1,6 +1,10 @@
 """Tests for markdown formatting functionality, specifically bullet-list blank-line handling."""
 
+import mdformat
+import pytest
+
 from obsistant.core import format_markdown
+from obsistant.core.formatting import MDFORMAT_GFM_AVAILABLE
 
 
 class TestFormatMarkdownBulletLists:
@@ -445,3 +449,30 @@ Final paragraph.
                         f"Found blank line between list items at line {i + 1}"
                     )
         assert result.strip() == expected.strip()
+
+
+class TestFormatMarkdownPlainText:
+    """Test that plain prose skips the parser with identical output."""
+
+    @pytest.mark.parametrize(
+        "input_text",
+        [
+            "",
+            "   ",
+            "Some text",
+            "Some  text with   spaces ",
+            "First line\nsecond line",
+            "\n\nFirst paragraph.\n\n\n\nSecond paragraph.\n",
+            "Hard break  \nnext line",
+            "  Indented, but not a code block.",
+            "Quotes: 'single' and \"double\"; done?",
+        ],
+    )
+    def test_plain_text_matches_mdformat(self, input_text: str) -> None:
+        """Test plain text formats exactly as the markdown parser would."""
+        expected = mdformat.text(
+            input_text,
+            options={"wrap": "no", "number": False},
+            extensions=("gfm",) if MDFORMAT_GFM_AVAILABLE else (),
+        )
+        assert format_markdown(input_text) == expected
@@ -1,8 +1,17 @@
 """Tests for the processor module."""
 
+import logging
 import os
-from datetime import datetime
+import types
+from datetime import date, datetime
+from functools import cache
 from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+import yaml
+from pyfakefs.fake_filesystem import FakeFilesystem
+from pyfakefs.helpers import set_uid
 
 from obsistant.backup import (
     clear_backups,
@@ -10,12 +19,15 @@ from obsistant.backup import (
     create_vault_backup,
     restore_files,
 )
+from obsistant.config import Config
 from obsistant.core import (
     extract_date_from_body,
     extract_granola_link,
     extract_tags,
+    find_tags,
     format_markdown,
     get_file_creation_date,
+    get_file_dates,
     merge_frontmatter,
     parse_date_string,
     process_file,
@@ -25,14 +37,33 @@ from obsistant.core import (
 )
 from obsistant.meetings.processor import _generate_meeting_filename
 from obsistant.notes.processor import _find_target_folder_for_tags, _move_file_to_folder
+from obsistant.utils import log_change
 from obsistant.vault import process_vault
 
+# Static file contents, pre-encoded once for the filesystem-backed tests
+_CONTENT = b"content"
+_BACKUP_CONTENT = b"backup content"
+_TAG_DOC = b"# Test\n\nThis has #tag1 and #tag2"
+_FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def logger() -> Mock:
+    """Create a mock logger for testing."""
+    return Mock(spec=logging.Logger)
+
+
+def _write_files(files: dict[Path, str]) -> None:
+    """Helper function to create a vault layout from a path->content mapping."""
+    for path, contents in files.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(contents)
+
 
+@cache
 def read_fixture(filename: str) -> str:
-    """Helper function to read fixture files."""
-    fixture_path = os.path.join(os.path.dirname(__file__), "fixtures", filename)
-    with open(fixture_path, encoding="utf-8") as f:
-        return f.read()
+    """Helper function to read fixture files, each read from disk once."""
+    return (_FIXTURES / filename).read_text(encoding="utf-8")
 
 
 class TestExtractTags:
@@ -120,6 +151,14 @@ And #real-tag2 after comment"""
         assert tags == set()  # Hash in longer string should be ignored
         assert body == text
 
+    def test_extract_tags_with_custom_regex(self) -> None:
+        config = Config()
+        config.tags.tag_regex = r"(?<!\w)#([a-z]+)(?=\s|$)"
+        text = "This has #lower and #Upper tags"
+        tags, body = extract_tags(text, config)
+        assert tags == {"lower"}
+        assert body == "This has  and #Upper tags"
+
 
 class TestSplitFrontmatter:
     """Test frontmatter splitting functionality."""
@@ -190,6 +229,20 @@ class TestRenderFrontmatter:
         assert "title: Test" in result
         assert "tags:" in result
 
+    def test_render_matches_yaml_dump(self) -> None:
+        data = {
+            "created": "2024-01-15",
+            "modified": date(2024, 1, 20),
+            "meeting-transcript": "https://notes.granola.ai/d/123",
+            "tags": ["meeting", "olt/products", "yes"],
+            "title": "Quarterly planning: Q1",
+            "priority": 1,
+        }
+        for end in range(1, len(data) + 1):
+            subset = dict(list(data.items())[:end])
+            expected = "---\n" + yaml.safe_dump(subset, sort_keys=False) + "---\n"
+            assert render_frontmatter(subset) == expected
+
 
 class TestFormatMarkdown:
     """Test markdown formatting functionality."""
@@ -226,6 +279,23 @@ class TestGetFileCreationDate:
         assert len(date) == 10  # YYYY-MM-DD format
         assert date.count("-") == 2
 
+    def test_get_file_dates_single_stat(self, tmp_path: Path) -> None:
+        """Test that creation and modification dates come from one stat call."""
+        test_file = tmp_path / "test.md"
+        test_file.write_text("# Test")
+        timestamp = datetime(2024, 1, 10, 12).timestamp()
+        os.utime(test_file, (timestamp, timestamp))
+
+        real_stat = Path.stat
+        with patch.object(
+            Path, "stat", autospec=True, side_effect=real_stat
+        ) as mock_stat:
+            created, modified = get_file_dates(test_file)
+
+        assert mock_stat.call_count == 1
+        assert modified == "2024-01-10"
+        assert created <= modified
+
 
 class TestExtractGranolaLink:
     """Test granola link extraction functionality."""
@@ -303,68 +373,21 @@ More content after the link."""
 class TestExtractDateFromBody:
     """Test date extraction from body functionality."""
 
-    def test_extract_iso_date(self) -> None:
-        """Test extracting ISO format date."""
-        text = """# Meeting Notes
-
-Date: 2024-01-15
-
-Some content here."""
-
-        date = extract_date_from_body(text)
-        assert date == "2024-01-15"
-
-    def test_extract_us_date_format(self) -> None:
-        """Test extracting US date format."""
-        text = """# Meeting Notes
-
-Meeting on 01/15/2024 about project updates.
-
-Content here."""
-
-        date = extract_date_from_body(text)
-        assert date == "2024-01-15"
-
-    def test_extract_european_date_format(self) -> None:
-        """Test extracting European date format."""
-        text = """# Meeting Notes
-
-Date: 15/01/2024
-
-Content here."""
-
-        date = extract_date_from_body(text)
-        assert date == "2024-01-15"
-
-    def test_extract_long_date_format(self) -> None:
-        """Test extracting long date format."""
-        text = """# Meeting Notes
-
-Meeting held on January 15, 2024 in the conference room.
-
-Content here."""
-
-        date = extract_date_from_body(text)
-        assert date == "2024-01-15"
-
-    def test_extract_short_date_format(self) -> None:
-        """Test extracting short date format."""
-        text = """# Meeting Notes
-
-Date: Jan 15, 2024
-
-Content here."""
-
-        date = extract_date_from_body(text)
-        assert date == "2024-01-15"
-
-    def test_extract_date_with_dots(self) -> None:
-        """Test extracting date with dots."""
-        text = """# Meeting Notes
-
-Date: 15.01.2024
-
-Content here."""
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "Date: 2024-01-15",
+            "Meeting on 01/15/2024 about project updates.",
+            "Date: 15/01/2024",
+            "Meeting held on January 15, 2024 in the conference room.",
+            "Date: Jan 15, 2024",
+            "Date: 15.01.2024",
+        ],
+        ids=["iso", "us", "european", "long", "short", "dots"],
+    )
+    def test_extract_date_formats(self, line: str) -> None:
+        """Test extracting each supported date format."""
+        text = f"# Meeting Notes\n\n{line}\n\nContent here."
 
         date = extract_date_from_body(text)
         assert date == "2024-01-15"
@@ -424,49 +447,25 @@ Content here."""
         date = extract_date_from_body(text)
         assert date == "2024-01-15"
 
+    def test_pattern_order_wins_within_line(self) -> None:
+        """Test that earlier patterns win over earlier positions in a line."""
+        text = "Due 02/20/2024, created 2024-01-15"
 
-class TestParseDateString:
-    """Test date string parsing functionality."""
-
-    def test_parse_iso_date(self) -> None:
-        """Test parsing ISO date format."""
-        result = parse_date_string("2024-01-15")
-        assert result is not None
-        assert result.year == 2024
-        assert result.month == 1
-        assert result.day == 15
+        date = extract_date_from_body(text)
+        assert date == "2024-01-15"
 
-    def test_parse_us_date(self) -> None:
-        """Test parsing US date format."""
-        result = parse_date_string("01/15/2024")
-        assert result is not None
-        assert result.year == 2024
-        assert result.month == 1
-        assert result.day == 15
 
-    def test_parse_european_date(self) -> None:
-        """Test parsing European date format."""
-        result = parse_date_string("15/01/2024")
-        assert result is not None
-        assert result.year == 2024
-        assert result.month == 1
-        assert result.day == 15
-
-    def test_parse_long_date(self) -> None:
-        """Test parsing long date format."""
-        result = parse_date_string("January 15, 2024")
-        assert result is not None
-        assert result.year == 2024
-        assert result.month == 1
-        assert result.day == 15
+class TestParseDateString:
+    """Test date string parsing functionality."""
 
-    def test_parse_short_date(self) -> None:
-        """Test parsing short date format."""
-        result = parse_date_string("Jan 15, 2024")
-        assert result is not None
-        assert result.year == 2024
-        assert result.month == 1
-        assert result.day == 15
+    @pytest.mark.parametrize(
+        "date_str",
+        ["2024-01-15", "01/15/2024", "15/01/2024", "January 15, 2024", "Jan 15, 2024"],
+        ids=["iso", "us", "european", "long", "short"],
+    )
+    def test_parse_date_formats(self, date_str: str) -> None:
+        """Test parsing each supported date format."""
+        assert parse_date_string(date_str) == datetime(2024, 1, 15)
 
     def test_parse_invalid_date(self) -> None:
         """Test parsing invalid date string."""
@@ -478,6 +477,11 @@ class TestParseDateString:
         result = parse_date_string("")
         assert result is None
 
+    def test_parse_out_of_range_iso_date(self) -> None:
+        """Test parsing an ISO-shaped string that is not a valid date."""
+        result = parse_date_string("2024-02-30")
+        assert result is None
+
 
 class TestMergeFrontmatterWithBodyDate:
     """Test frontmatter merging with date from body."""
@@ -507,206 +511,113 @@ Content here."""
         assert result["created"] == "2024-02-20"  # Should preserve existing date
         assert "tag1" in result["tags"]
 
-    def test_merge_falls_back_to_file_date(self) -> None:
-        """Test that file creation date is used when no date in body."""
-        # Create a temporary file for testing
-        import tempfile
-        from pathlib import Path
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write("# Test")
-            temp_path = Path(f.name)
+    @pytest.fixture
+    def md_tmpfile(self, tmp_path: Path) -> Path:
+        """Create a small markdown file to take file dates from."""
+        path = tmp_path / "note.md"
+        path.write_text("# Test")
+        return path
 
-        try:
-            body = """# Meeting Notes
+    def test_merge_falls_back_to_file_date(self, md_tmpfile: Path) -> None:
+        """Test that file creation date is used when no date in body."""
+        body = """# Meeting Notes
 
 No date in this content."""
 
-            result = merge_frontmatter(None, {"tag1"}, None, temp_path, body)
-            assert "created" in result
-            assert len(result["created"]) == 10  # YYYY-MM-DD format
-            assert result["created"].count("-") == 2
-            assert "tag1" in result["tags"]
-        finally:
-            temp_path.unlink()
+        result = merge_frontmatter(None, {"tag1"}, None, md_tmpfile, body)
+        assert "created" in result
+        assert len(result["created"]) == 10  # YYYY-MM-DD format
+        assert result["created"].count("-") == 2
+        assert "tag1" in result["tags"]
 
-    def test_merge_uses_earliest_date_between_body_and_file(self) -> None:
+    @pytest.mark.parametrize(
+        ("file_date", "expected"),
+        [
+            # File date earlier than the body date wins
+            (datetime(2024, 1, 10), "2024-01-10"),
+            # Body date earlier than the file date wins
+            (datetime(2024, 1, 20), "2024-01-15"),
+        ],
+        ids=["file-earlier", "body-earlier"],
+    )
+    def test_merge_uses_earliest_date_between_body_and_file(
+        self, md_tmpfile: Path, file_date: datetime, expected: str
+    ) -> None:
         """Test that the earliest date between body and file is used for created."""
-        import os
-        import tempfile
-        from pathlib import Path
-
-        # Create a temporary file with a specific creation date
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write("# Test")
-            temp_path = Path(f.name)
-
-        try:
-            # Set file creation time to 2024-01-10 (earlier than body date)
-            target_timestamp = datetime(2024, 1, 10).timestamp()
-            os.utime(temp_path, (target_timestamp, target_timestamp))
-
-            body = """# Meeting Notes
+        target_timestamp = file_date.timestamp()
+        os.utime(md_tmpfile, (target_timestamp, target_timestamp))
 
-Date: 2024-01-15
-
-Content here."""
-
-            result = merge_frontmatter(None, {"tag1"}, None, temp_path, body)
-            # Should use the earlier date (file creation date)
-            assert result["created"] == "2024-01-10"
-            assert "tag1" in result["tags"]
-        finally:
-            temp_path.unlink()
-
-    def test_merge_uses_body_date_when_earlier_than_file(self) -> None:
-        """Test that body date is used when it's earlier than file creation date."""
-        import os
-        import tempfile
-        from pathlib import Path
-
-        # Create a temporary file with a later creation date
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write("# Test")
-            temp_path = Path(f.name)
-
-        try:
-            # Set file creation time to 2024-01-20 (later than body date)
-            target_timestamp = datetime(2024, 1, 20).timestamp()
-            os.utime(temp_path, (target_timestamp, target_timestamp))
-
-            body = """# Meeting Notes
+        body = """# Meeting Notes
 
 Date: 2024-01-15
 
 Content here."""
 
-            result = merge_frontmatter(None, {"tag1"}, None, temp_path, body)
-            # Should use the earlier date (body date)
-            assert result["created"] == "2024-01-15"
-            assert "tag1" in result["tags"]
-        finally:
-            temp_path.unlink()
+        result = merge_frontmatter(None, {"tag1"}, None, md_tmpfile, body)
+        assert result["created"] == expected
+        assert "tag1" in result["tags"]
 
-    def test_merge_adds_modification_date(self) -> None:
+    def test_merge_adds_modification_date(self, md_tmpfile: Path) -> None:
         """Test that modification date is always added from file metadata."""
-        import tempfile
-        from pathlib import Path
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write("# Test")
-            temp_path = Path(f.name)
-
-        try:
-            body = """# Meeting Notes
+        body = """# Meeting Notes
 
 Date: 2024-01-15
 
 Content here."""
 
-            result = merge_frontmatter(None, {"tag1"}, None, temp_path, body)
-            assert "modified" in result
-            assert len(result["modified"]) == 10  # YYYY-MM-DD format
-            assert result["modified"].count("-") == 2
-            assert "tag1" in result["tags"]
-        finally:
-            temp_path.unlink()
+        result = merge_frontmatter(None, {"tag1"}, None, md_tmpfile, body)
+        assert "modified" in result
+        assert len(result["modified"]) == 10  # YYYY-MM-DD format
+        assert result["modified"].count("-") == 2
+        assert "tag1" in result["tags"]
 
-    def test_merge_updates_modification_date_when_different(self) -> None:
+    def test_merge_updates_modification_date_when_different(
+        self, md_tmpfile: Path
+    ) -> None:
         """Test that modification date is updated when it differs from existing."""
-        import tempfile
-        from pathlib import Path
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write("# Test")
-            temp_path = Path(f.name)
-
-        try:
-            existing = {"modified": "2024-01-01"}  # Old modification date
-            body = """# Meeting Notes
+        existing = {"modified": "2024-01-01"}  # Old modification date
+        body = """# Meeting Notes
 
 Content here."""
 
-            result = merge_frontmatter(existing, {"tag1"}, None, temp_path, body)
-            # Should update to current file modification date
-            assert "modified" in result
-            assert result["modified"] != "2024-01-01"  # Should be updated
-            assert "tag1" in result["tags"]
-        finally:
-            temp_path.unlink()
+        result = merge_frontmatter(existing, {"tag1"}, None, md_tmpfile, body)
+        # Should update to current file modification date
+        assert "modified" in result
+        assert result["modified"] != "2024-01-01"  # Should be updated
+        assert "tag1" in result["tags"]
 
-    def test_frontmatter_property_ordering(self) -> None:
+    def test_frontmatter_property_ordering(self, md_tmpfile: Path) -> None:
         """Test that frontmatter properties are in the correct order: created, modified, meeting-transcript, tags."""
-        import tempfile
-        from pathlib import Path
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write("# Test")
-            temp_path = Path(f.name)
-
-        try:
-            existing = {
-                "title": "My Note",
-                "author": "John Doe",
-                "other_field": "value",
-            }
-            body = """# Meeting Notes
+        existing = {
+            "title": "My Note",
+            "author": "John Doe",
+            "other_field": "value",
+        }
+        body = """# Meeting Notes
 
 Date: 2024-01-15
 
 Content here."""
 
-            result = merge_frontmatter(
-                existing,
-                {"tag1", "tag2"},
-                "https://example.com/transcript",
-                temp_path,
-                body,
-            )
-
-            # Check that properties exist
-            assert "created" in result
-            assert "modified" in result
-            assert "meeting-transcript" in result
-            assert "tags" in result
-
-            # Convert to list to check order
-            keys = list(result.keys())
-
-            # Find indices of our key properties
-            created_idx = keys.index("created")
-            modified_idx = keys.index("modified")
-            meeting_transcript_idx = keys.index("meeting-transcript")
-            tags_idx = keys.index("tags")
-
-            # Check the order: created < modified < meeting-transcript < tags
-            assert created_idx < modified_idx, (
-                f"created should come before modified, but got order: {keys}"
-            )
-            assert modified_idx < meeting_transcript_idx, (
-                f"modified should come before meeting-transcript, but got order: {keys}"
-            )
-            assert meeting_transcript_idx < tags_idx, (
-                f"meeting-transcript should come before tags, but got order: {keys}"
-            )
-
-            # Check that other properties come after our main properties
-            title_idx = keys.index("title")
-            author_idx = keys.index("author")
-            other_field_idx = keys.index("other_field")
-
-            assert tags_idx < title_idx, (
-                f"tags should come before other properties, but got order: {keys}"
-            )
-            assert tags_idx < author_idx, (
-                f"tags should come before other properties, but got order: {keys}"
-            )
-            assert tags_idx < other_field_idx, (
-                f"tags should come before other properties, but got order: {keys}"
-            )
+        result = merge_frontmatter(
+            existing,
+            {"tag1", "tag2"},
+            "https://example.com/transcript",
+            md_tmpfile,
+            body,
+        )
 
-        finally:
-            temp_path.unlink()
+        # created, modified, meeting-transcript and tags come first, followed by
+        # the other existing properties in their original order
+        assert list(result) == [
+            "created",
+            "modified",
+            "meeting-transcript",
+            "tags",
+            "title",
+            "author",
+            "other_field",
+        ]
 
 
 class TestExtractTagsWithFixtures:
@@ -747,6 +658,21 @@ class TestExtractTagsWithFixtures:
         assert "code-tag" not in tags  # From inline code
         assert "world" not in tags  # From code block
 
+    @pytest.mark.parametrize(
+        "filename",
+        [
+            "edge_cases.md",
+            "existing_front_matter_multiple_tags.md",
+            "no_front_matter_single_tag.md",
+            "no_tags.md",
+        ],
+    )
+    def test_find_tags_matches_extract_tags(self, filename: str) -> None:
+        """Test that find_tags finds the same tags extract_tags removes."""
+        content = read_fixture(filename)
+        tags, _ = extract_tags(content)
+        assert find_tags(content) == tags
+
 
 class TestMergeFrontmatterWithFixtures:
     """Test frontmatter merging with fixture files."""
@@ -850,8 +776,8 @@ class TestBackupAndRestore:
         # Create backup structure
         backup_root = vault_root.parent / f"{vault_root.name}_backups"
         backup_root.mkdir()
-        (backup_root / "note1.md.bak").write_text("backup content")
-        (backup_root / "note2.md.bak").write_text("backup content")
+        (backup_root / "note1.md.bak").write_bytes(_BACKUP_CONTENT)
+        (backup_root / "note2.md.bak").write_bytes(_BACKUP_CONTENT)
 
         deleted_count = clear_backups(vault_root)
 
@@ -870,7 +796,7 @@ class TestBackupAndRestore:
         # Create backup
         backup_root = vault_root.parent / f"{vault_root.name}_backups"
         backup_root.mkdir()
-        (backup_root / "note.md.bak").write_text("backup content")
+        (backup_root / "note.md.bak").write_bytes(_BACKUP_CONTENT)
 
         # Corrupt original file
         original_file.write_text("corrupted content")
@@ -879,7 +805,7 @@ class TestBackupAndRestore:
         restored_count = restore_files(vault_root)
 
         assert restored_count == 1
-        assert original_file.read_text() == "backup content"
+        assert original_file.read_bytes() == _BACKUP_CONTENT
 
     def test_create_backup_path(self, tmp_path: Path) -> None:
         """Test creating backup path structure."""
@@ -888,7 +814,7 @@ class TestBackupAndRestore:
 
         file_path = vault_root / "subfolder" / "note.md"
         file_path.parent.mkdir()
-        file_path.write_text("content")
+        file_path.write_bytes(_CONTENT)
 
         backup_path = create_backup_path(vault_root, file_path, ".bak")
 
@@ -900,55 +826,67 @@ class TestBackupAndRestore:
         )
         assert backup_path == expected_path
 
+    @pytest.mark.parametrize(
+        "file_path",
+        [
+            Path("/notes/other/note.md"),
+            Path("/notes/vault2/note.md"),
+            Path("vault/note.md"),
+        ],
+    )
+    def test_create_backup_path_outside_vault(self, file_path: Path) -> None:
+        """Test creating a backup path for a file outside the vault fails."""
+        with pytest.raises(ValueError):
+            create_backup_path(Path("/notes/vault"), file_path, ".bak")
+
+    def test_create_backup_path_keeps_parent_segments(self) -> None:
+        """Test that `..` segments are kept as given, like Path.relative_to."""
+        backup_path = create_backup_path(
+            Path("/notes/vault"), Path("/notes/vault/a/../note.md"), ".bak"
+        )
+
+        assert backup_path == Path("/notes/vault_backups/a/../note.md.bak")
+
 
 class TestHelperFunctions:
     """Test helper functions."""
 
-    def test_find_target_folder_for_tags(self) -> None:
+    @pytest.mark.parametrize(
+        ("tags", "expected"),
+        [
+            # Direct tag match
+            (["products"], "products"),
+            (["projects"], "projects"),
+            # Subtag match
+            (["products/mobile"], "products/mobile"),
+            (["challenges/reach"], "challenges/reach"),
+            # olt/ prefixed tags
+            (["olt/products"], "products"),
+            (["olt/challenges/reach"], "challenges/reach"),
+            # No match
+            (["random"], None),
+            (["olt/random"], None),
+            # First match wins
+            (["products", "projects"], "products"),
+        ],
+    )
+    def test_find_target_folder_for_tags(
+        self, tags: list[str], expected: str | None
+    ) -> None:
         """Test finding target folder for tags."""
-        # Test direct tag match
-        assert _find_target_folder_for_tags(["products"]) == "products"
-        assert _find_target_folder_for_tags(["projects"]) == "projects"
-
-        # Test subtag match
-        assert _find_target_folder_for_tags(["products/mobile"]) == "products/mobile"
-        assert _find_target_folder_for_tags(["challenges/reach"]) == "challenges/reach"
-
-        # Test olt/ prefixed tags
-        assert _find_target_folder_for_tags(["olt/products"]) == "products"
-        assert (
-            _find_target_folder_for_tags(["olt/challenges/reach"]) == "challenges/reach"
-        )
-
-        # Test no match
-        assert _find_target_folder_for_tags(["random"]) is None
-        assert _find_target_folder_for_tags(["olt/random"]) is None
-
-        # Test first match wins
-        assert _find_target_folder_for_tags(["products", "projects"]) == "products"
+        assert _find_target_folder_for_tags(tags) == expected
 
-    def test_move_file_to_folder(self, tmp_path: Path) -> None:
+    def test_move_file_to_folder(self, fs: FakeFilesystem, logger: Mock) -> None:
         """Test moving file to folder with backup."""
-        vault_root = tmp_path / "vault"
-        vault_root.mkdir()
+        vault_root = Path("/vault")
 
         # Create source file
         source_file = vault_root / "source.md"
-        source_file.write_text("content")
+        fs.create_file(source_file, contents=_CONTENT)
 
         # Create target directory
         target_dir = vault_root / "target"
-        target_dir.mkdir()
-
-        # Mock logger
-        class MockLogger:
-            def info(self, msg: str) -> None:
-                pass
-
-            def warning(self, msg: str) -> None:
-                pass
-
-        logger = MockLogger()
+        fs.create_dir(target_dir)
 
         # Move file
         result = _move_file_to_folder(
@@ -969,13 +907,13 @@ class TestHelperFunctions:
         # Check backup was created
         backup_path = vault_root.parent / f"{vault_root.name}_backups" / "source.md.bak"
         assert backup_path.exists()
-        assert backup_path.read_text() == "content"
+        assert backup_path.read_bytes() == _CONTENT
 
-    def test_generate_meeting_filename(self, tmp_path: Path) -> None:
+    def test_generate_meeting_filename(self, fs: FakeFilesystem) -> None:
         """Test generating meeting filename."""
         # Create test file
-        test_file = tmp_path / "test_meeting.md"
-        test_file.write_text("content")
+        test_file = Path("/test_meeting.md")
+        fs.create_file(test_file, contents=_CONTENT)
 
         # Test with frontmatter date
         frontmatter = {"created": "2024-01-15"}
@@ -988,48 +926,57 @@ class TestHelperFunctions:
         assert result.endswith("_test_meeting.md")
         assert len(result.split("_")[0]) == 6  # YYMMDD format
 
-    def test_walk_markdown_files(self, tmp_path: Path) -> None:
+    def test_walk_markdown_files(self, fs: FakeFilesystem) -> None:
         """Test walking markdown files."""
-        vault_root = tmp_path / "vault"
-        vault_root.mkdir()
+        vault_root = Path("/vault")
 
         # Create test files
-        (vault_root / "note1.md").write_text("content")
-        (vault_root / "note2.txt").write_text("content")  # Non-markdown
+        fs.create_file(vault_root / "note1.md", contents=_CONTENT)
+        fs.create_file(vault_root / "note2.txt", contents=_CONTENT)  # Non-markdown
         subfolder = vault_root / "subfolder"
-        subfolder.mkdir()
-        (subfolder / "note3.md").write_text("content")
+        fs.create_file(subfolder / "note3.md", contents=_CONTENT)
+
+        # Walk markdown files lazily
+        assert isinstance(walk_markdown_files(vault_root), types.GeneratorType)
+
+        md_files = set(walk_markdown_files(vault_root))
 
-        # Walk markdown files
-        md_files = list(walk_markdown_files(vault_root))
+        assert md_files == {vault_root / "note1.md", subfolder / "note3.md"}
 
-        assert len(md_files) == 2
-        assert vault_root / "note1.md" in md_files
-        assert subfolder / "note3.md" in md_files
-        assert vault_root / "note2.txt" not in md_files
+    def test_log_change_prints_brackets_literally(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that bracketed text in log lines is not swallowed as markup."""
+        log_change(Path("notes/[draft] idea.md"), 1, 0, True)
+
+        out = capsys.readouterr().out
+        assert "notes/[draft] idea.md: +1 tags, -0 tags [dry-run]" in out
+
+    def test_walk_markdown_files_exclude(self, fs: FakeFilesystem) -> None:
+        """Test that excluded directories are pruned from the walk."""
+        vault_root = Path("/vault")
+        fs.create_file(vault_root / "note1.md", contents=_CONTENT)
+        fs.create_file(vault_root / "skip" / "note2.md", contents=_CONTENT)
+        fs.create_file(vault_root / "keep" / "skip" / "note3.md", contents=_CONTENT)
+
+        md_files = set(walk_markdown_files(vault_root, exclude={vault_root / "skip"}))
+
+        assert md_files == {
+            vault_root / "note1.md",
+            vault_root / "keep" / "skip" / "note3.md",
+        }
 
 
 class TestProcessFile:
     """Test process_file function."""
 
-    def test_process_file_with_tags(self, tmp_path: Path) -> None:
+    def test_process_file_with_tags(self, fs: FakeFilesystem, logger: Mock) -> None:
         """Test processing file with tags."""
-        vault_root = tmp_path / "vault"
-        vault_root.mkdir()
+        vault_root = Path("/vault")
 
         # Create test file with tags
         test_file = vault_root / "test.md"
-        test_file.write_text("# Test\n\nThis has #tag1 and #tag2")
-
-        # Mock logger
-        class MockLogger:
-            def info(self, msg: str) -> None:
-                pass
-
-            def error(self, msg: str) -> None:
-                pass
-
-        logger = MockLogger()
+        fs.create_file(test_file, contents=_TAG_DOC)
 
         # Process file
         stats = process_file(test_file, vault_root, False, ".bak", logger)
@@ -1040,97 +987,127 @@ class TestProcessFile:
 
         # Check file was updated
         content = test_file.read_text()
-        assert "---" in content  # Frontmatter added
-        assert "tags:" in content
-        assert "tag1" in content
-        assert "tag2" in content
-        assert "This has  and " in content  # Tags removed from body
+        assert content.startswith("---\n")  # Frontmatter added
+        frontmatter, body = split_frontmatter(content)
+        assert frontmatter is not None
+        assert frontmatter["tags"] == ["tag1", "tag2"]
+        assert body.endswith("This has  and ")  # Tags removed from body
 
-    def test_process_file_dry_run(self, tmp_path: Path) -> None:
+    def test_process_file_dry_run(self, fs: FakeFilesystem, logger: Mock) -> None:
         """Test processing file in dry run mode."""
-        vault_root = tmp_path / "vault"
-        vault_root.mkdir()
+        vault_root = Path("/vault")
 
         test_file = vault_root / "test.md"
         original_content = "# Test\n\nThis has #tag1"
-        test_file.write_text(original_content)
-
-        class MockLogger:
-            def info(self, msg: str) -> None:
-                pass
-
-            def error(self, msg: str) -> None:
-                pass
-
-        logger = MockLogger()
+        fs.create_file(test_file, contents=original_content)
 
         # Process file in dry run
         stats = process_file(test_file, vault_root, True, ".bak", logger)
 
         assert stats["processed"] is False  # No actual processing in dry run
+        assert stats["added_tags"] == 1  # Still reports what would change
         assert test_file.read_text() == original_content  # File unchanged
+        assert not Path("/vault_backups").exists()  # No backup written
+
+
+@pytest.fixture(scope="class")
+def vault_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the shared vault layout once per test class."""
+    template = tmp_path_factory.mktemp("template")
+    _write_files(
+        {
+            template / "note1.md": "# Note 1\n\n#tag1",
+            template / "note2.md": "# Note 2\n\n#tag2",
+            template / "subfolder" / "note3.md": "# Note 3\n\n#tag3",
+        }
+    )
+    return template
 
 
 class TestProcessVault:
     """Test process_vault function."""
 
-    def test_process_vault_all_files(self, tmp_path: Path) -> None:
-        """Test processing entire vault."""
-        vault_root = tmp_path / "vault"
-        vault_root.mkdir()
+    @pytest.fixture
+    def vault_root(self, fs: FakeFilesystem, vault_template: Path) -> Path:
+        """Copy the vault template into the fake filesystem for one test."""
+        vault_root = Path("/vault")
+        fs.add_real_directory(vault_template, read_only=False, target_path=vault_root)
+        return vault_root
 
-        # Create test files
-        (vault_root / "note1.md").write_text("# Note 1\n\n#tag1")
-        (vault_root / "note2.md").write_text("# Note 2\n\n#tag2")
+    def test_process_vault_all_files(self, vault_root: Path, logger: Mock) -> None:
+        """Test processing entire vault."""
         subfolder = vault_root / "subfolder"
-        subfolder.mkdir()
-        (subfolder / "note3.md").write_text("# Note 3\n\n#tag3")
-
-        class MockLogger:
-            def info(self, msg: str) -> None:
-                pass
-
-            def error(self, msg: str) -> None:
-                pass
-
-        logger = MockLogger()
 
         # Process vault
         process_vault(str(vault_root), False, ".bak", logger)
 
         # Check all files were processed
-        for file_path in [
-            vault_root / "note1.md",
-            vault_root / "note2.md",
-            subfolder / "note3.md",
+        for file_path, tag in [
+            (vault_root / "note1.md", "tag1"),
+            (vault_root / "note2.md", "tag2"),
+            (subfolder / "note3.md", "tag3"),
         ]:
             content = file_path.read_text()
-            assert "---" in content  # Frontmatter added
-            assert "tags:" in content
+            assert content.startswith("---\n")  # Frontmatter added
+            frontmatter, _ = split_frontmatter(content)
+            assert frontmatter is not None
+            assert frontmatter["tags"] == [tag]
 
-    def test_process_vault_specific_file(self, tmp_path: Path) -> None:
+    def test_process_vault_specific_file(self, vault_root: Path, logger: Mock) -> None:
         """Test processing specific file in vault."""
-        vault_root = tmp_path / "vault"
-        vault_root.mkdir()
-
-        # Create test files
         file1 = vault_root / "note1.md"
         file2 = vault_root / "note2.md"
-        file1.write_text("# Note 1\n\n#tag1")
-        file2.write_text("# Note 2\n\n#tag2")
-
-        class MockLogger:
-            def info(self, msg: str) -> None:
-                pass
-
-            def error(self, msg: str) -> None:
-                pass
-
-        logger = MockLogger()
 
         # Process only specific file
         process_vault(str(vault_root), False, ".bak", logger, specific_file=file1)
 
         # Check only file1 was processed
-        assert "tags:" in file1.read_text()
-        assert "tags:" not in file2.read_text()
+        assert file1.read_text().startswith("---\n")
+        assert file2.read_text() == "# Note 2\n\n#tag2"
+
+    def test_process_vault_skips_unchanged_files(
+        self, vault_root: Path, logger: Mock
+    ) -> None:
+        """Test re-running on an unchanged vault only processes modified files."""
+        process_vault(str(vault_root), False, ".bak", logger)
+
+        with patch(
+            "obsistant.vault.processor.process_file", wraps=process_file
+        ) as mock_process:
+            process_vault(str(vault_root), False, ".bak", logger)
+            assert mock_process.call_count == 0
+
+            note2 = vault_root / "note2.md"
+            note2.write_text(note2.read_text() + "\n#tag4")
+            process_vault(str(vault_root), False, ".bak", logger)
+            assert [call.args[0] for call in mock_process.call_args_list] == [note2]
+
+        frontmatter, _ = split_frontmatter(note2.read_text())
+        assert frontmatter is not None
+        assert frontmatter["tags"] == ["tag2", "tag4"]
+
+    def test_process_vault_retries_unreadable_files(
+        self, vault_root: Path, logger: Mock
+    ) -> None:
+        """Test a file that failed to read is not cached and is retried next run."""
+        # Run as a regular user who owns the vault, so only note1 is unreadable
+        for path in [Path("/"), vault_root, *vault_root.rglob("*")]:
+            os.chown(path, 1000, 1000)
+        note1 = vault_root / "note1.md"
+        note1.chmod(0o000)
+        set_uid(1000)
+        try:
+            process_vault(str(vault_root), False, ".bak", logger)
+        finally:
+            set_uid(0)
+        assert note1.read_text() == "# Note 1\n\n#tag1"
+
+        # Making the file readable again only changes its ctime
+        note1.chmod(0o644)
+        with patch(
+            "obsistant.vault.processor.process_file", wraps=process_file
+        ) as mock_process:
+            process_vault(str(vault_root), False, ".bak", logger)
+            assert [call.args[0] for call in mock_process.call_args_list] == [note1]
+
+        assert note1.read_text().startswith("---\n")
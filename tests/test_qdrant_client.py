@@ -2,95 +2,81 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from qdrant_client.models import ScalarType
 
 from obsistant.qdrant.client import ensure_collection, get_qdrant_client
 
 
-class TestGetQdrantClient:
-    """Test get_qdrant_client function."""
-
-    @patch("obsistant.qdrant.client.is_qdrant_running")
-    @patch("obsistant.qdrant.client.QdrantClient")
-    def test_get_client_success(
-        self,
-        mock_qdrant_client_class: MagicMock,
-        mock_is_running: MagicMock,
-        tmp_path: Path,
-    ) -> None:
-        """Test successful client initialization."""
-        vault_path = tmp_path / "vault"
-        vault_path.mkdir()
+@pytest.fixture
+def mock_qdrant_env() -> Iterator[tuple[MagicMock, MagicMock, MagicMock]]:
+    """Patch the Qdrant client class and server check for a running server.
 
+    Yields:
+        Tuple of (QdrantClient class mock, is_qdrant_running mock, client mock).
+    """
+    with (
+        patch("obsistant.qdrant.client.QdrantClient") as mock_client_class,
+        patch("obsistant.qdrant.client.is_qdrant_running") as mock_is_running,
+    ):
         mock_is_running.return_value = True
-        mock_client = MagicMock()
+        mock_client = mock_client_class.return_value
         mock_client.get_collections.return_value = []
-        mock_qdrant_client_class.return_value = mock_client
+        yield mock_client_class, mock_is_running, mock_client
 
-        client = get_qdrant_client(vault_path)
 
-        assert client == mock_client
-        mock_is_running.assert_called_once_with(vault_path)
-        mock_qdrant_client_class.assert_called_once_with(url="http://localhost:6333")
-        mock_client.get_collections.assert_called_once()
+class TestGetQdrantClient:
+    """Test get_qdrant_client function."""
 
-    @patch("obsistant.qdrant.client.is_qdrant_running")
-    @patch("obsistant.qdrant.client.QdrantClient")
-    def test_get_client_custom_url(
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_url"),
+        [
+            ({}, "http://localhost:6333"),
+            ({"url": "http://localhost:8080"}, "http://localhost:8080"),
+        ],
+    )
+    def test_get_client_success(
         self,
-        mock_qdrant_client_class: MagicMock,
-        mock_is_running: MagicMock,
+        mock_qdrant_env: tuple[MagicMock, MagicMock, MagicMock],
         tmp_path: Path,
+        kwargs: dict[str, str],
+        expected_url: str,
     ) -> None:
-        """Test client initialization with custom URL."""
-        vault_path = tmp_path / "vault"
-        vault_path.mkdir()
-
-        mock_is_running.return_value = True
-        mock_client = MagicMock()
-        mock_client.get_collections.return_value = []
-        mock_qdrant_client_class.return_value = mock_client
+        """Test successful client initialization with default and custom URLs."""
+        mock_client_class, mock_is_running, mock_client = mock_qdrant_env
 
-        client = get_qdrant_client(vault_path, url="http://localhost:8080")
+        client = get_qdrant_client(tmp_path, **kwargs)
 
         assert client == mock_client
-        mock_qdrant_client_class.assert_called_once_with(url="http://localhost:8080")
+        mock_is_running.assert_called_once_with(tmp_path)
+        mock_client_class.assert_called_once_with(url=expected_url)
+        mock_client.get_collections.assert_called_once()
 
-    @patch("obsistant.qdrant.client.is_qdrant_running")
     def test_get_client_server_not_running(
-        self, mock_is_running: MagicMock, tmp_path: Path
+        self, mock_qdrant_env: tuple[MagicMock, MagicMock, MagicMock], tmp_path: Path
     ) -> None:
         """Test that client initialization raises error when server is not running."""
-        vault_path = tmp_path / "vault"
-        vault_path.mkdir()
-
+        mock_client_class, mock_is_running, _ = mock_qdrant_env
         mock_is_running.return_value = False
 
         with pytest.raises(RuntimeError, match="Qdrant server is not running"):
-            get_qdrant_client(vault_path)
+            get_qdrant_client(tmp_path)
+
+        mock_client_class.assert_not_called()
 
-    @patch("obsistant.qdrant.client.is_qdrant_running")
-    @patch("obsistant.qdrant.client.QdrantClient")
     def test_get_client_connection_failure(
-        self,
-        mock_qdrant_client_class: MagicMock,
-        mock_is_running: MagicMock,
-        tmp_path: Path,
+        self, mock_qdrant_env: tuple[MagicMock, MagicMock, MagicMock], tmp_path: Path
     ) -> None:
         """Test that client initialization raises error on connection failure."""
-        vault_path = tmp_path / "vault"
-        vault_path.mkdir()
-
-        mock_is_running.return_value = True
-        mock_client = MagicMock()
+        _, _, mock_client = mock_qdrant_env
         mock_client.get_collections.side_effect = Exception("Connection failed")
-        mock_qdrant_client_class.return_value = mock_client
 
         with pytest.raises(RuntimeError, match="Failed to connect to Qdrant server"):
-            get_qdrant_client(vault_path)
+            get_qdrant_client(tmp_path)
 
 
 class TestEnsureCollection:
@@ -157,6 +143,47 @@ class TestEnsureCollection:
         call_args = mock_client.create_collection.call_args
         assert call_args[1]["vectors_config"].size == 1536
 
+    def test_ensure_collection_quantization(self) -> None:
+        """Test that ensure_collection enables int8 scalar quantization by default."""
+        mock_client = MagicMock()
+        mock_client.collection_exists.return_value = False
+
+        ensure_collection(mock_client, "test-collection")
+
+        quantization = mock_client.create_collection.call_args[1]["quantization_config"]
+        assert quantization.scalar.type == ScalarType.INT8
+        assert quantization.scalar.always_ram is True
+
+    def test_ensure_collection_without_quantization(self) -> None:
+        """Test that ensure_collection can create an unquantized collection."""
+        mock_client = MagicMock()
+        mock_client.collection_exists.return_value = False
+
+        ensure_collection(mock_client, "test-collection", quantize=False)
+
+        call_args = mock_client.create_collection.call_args
+        assert call_args[1]["quantization_config"] is None
+
+    def test_ensure_collection_remembers_existing(self) -> None:
+        """Test that repeated calls for a known collection skip the server check."""
+        mock_client = MagicMock()
+        mock_client.collection_exists.return_value = True
+
+        ensure_collection(mock_client, "test-collection")
+        ensure_collection(mock_client, "test-collection")
+
+        mock_client.collection_exists.assert_called_once_with("test-collection")
+
+    def test_ensure_collection_recreate_ignores_known(self) -> None:
+        """Test that recreate=True still deletes a collection already known."""
+        mock_client = MagicMock()
+        mock_client.collection_exists.return_value = True
+        ensure_collection(mock_client, "test-collection")
+
+        ensure_collection(mock_client, "test-collection", recreate=True)
+
+        mock_client.delete_collection.assert_called_once_with("test-collection")
+
     def test_ensure_collection_delete_error(self) -> None:
         """Test that ensure_collection raises error when delete fails."""
         mock_client = MagicMock()
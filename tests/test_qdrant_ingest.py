@@ -3,15 +3,20 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from obsistant.config import Config
 from obsistant.qdrant.ingest import (
+    _build_chunk_points,
+    _chunk_point_ids,
     build_payload,
     collect_markdown_files,
     parse_markdown_file,
+    parse_markdown_files,
     semantic_chunk,
 )
 
@@ -86,6 +91,46 @@ def test_parse_markdown_file_without_frontmatter(
     assert "created" in result["metadata"]
 
 
+def test_parse_markdown_files_preserves_order_and_errors(
+    sample_vault: Path, sample_config: Config
+) -> None:
+    """Test bulk parsing yields results in input order, with errors in place."""
+    files = [
+        sample_vault / "20-Notes" / "note2.md",
+        sample_vault / "20-Notes" / "missing.md",
+        sample_vault / "20-Notes" / "note1.md",
+    ]
+
+    results = list(parse_markdown_files(files, sample_vault, sample_config))
+
+    assert len(results) == 3
+    assert not isinstance(results[0], Exception)
+    assert results[0]["metadata"]["tags"] == ["test"]
+    assert isinstance(results[1], OSError)
+    assert not isinstance(results[2], Exception)
+    assert str(results[2]["file_path"]) == "20-Notes/note1.md"
+
+
+def test_parse_markdown_files_limits_read_ahead(
+    monkeypatch: pytest.MonkeyPatch, sample_vault: Path, sample_config: Config
+) -> None:
+    """Test bulk parsing only reads a bounded number of files ahead."""
+    monkeypatch.setattr("obsistant.qdrant.ingest._PARSE_READ_AHEAD", 2)
+    parsed: list[Path] = []
+
+    def fake_parse(file_path: Path, vault_path: Path, config: Config) -> Any:
+        parsed.append(file_path)
+        return {"file_path": file_path}
+
+    monkeypatch.setattr("obsistant.qdrant.ingest.parse_markdown_file", fake_parse)
+    files = [sample_vault / f"note{i}.md" for i in range(10)]
+
+    results = parse_markdown_files(files, sample_vault, sample_config)
+    assert next(results)["file_path"] == files[0]
+    assert len(parsed) <= 3
+    assert [r["file_path"] for r in results] == files[1:]
+
+
 def test_semantic_chunk_empty_text() -> None:
     """Test semantic chunking with empty text."""
     chunks = semantic_chunk("")
@@ -176,7 +221,8 @@ def test_generate_embedding_success(mock_openai_class: MagicMock) -> None:
     embedding = generate_embedding("test text", client)
 
     assert len(embedding) == 3072
-    assert all(isinstance(x, float) for x in embedding)
+    assert embedding.dtype == np.float32
+    assert all(isinstance(x, float) for x in embedding.tolist())
 
 
 @patch("obsistant.qdrant.ingest.OpenAI")
@@ -198,3 +244,57 @@ def test_generate_embedding_retry(mock_openai_class: MagicMock) -> None:
 
     assert len(embedding) == 3072
     assert mock_client.embeddings.create.call_count == 2
+
+
+def test_generate_embeddings_batch_splits_requests() -> None:
+    """Test batch embedding sends one request per batch and keeps input order."""
+    from obsistant.qdrant.ingest import generate_embeddings_batch
+
+    mock_client = MagicMock()
+    mock_client.embeddings.create.side_effect = lambda input, model: MagicMock(
+        data=[MagicMock(embedding=[float(len(text))]) for text in input]
+    )
+    texts = ["a" * n for n in range(1, 6)]
+
+    embeddings = generate_embeddings_batch(texts, mock_client, batch_size=2)
+
+    assert embeddings.tolist() == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert mock_client.embeddings.create.call_count == 3
+    assert mock_client.embeddings.create.call_args_list[0][1]["input"] == ["a", "aa"]
+
+
+def test_chunk_point_ids_are_deterministic() -> None:
+    """Test chunk IDs depend on file, text and repeat count only."""
+    ids = _chunk_point_ids("note.md", ["a", "b", "a"])
+
+    assert ids == _chunk_point_ids("note.md", ["a", "b", "a"])
+    assert len(set(ids)) == 3
+    assert _chunk_point_ids("note.md", ["b"]) == [ids[1]]
+    assert _chunk_point_ids("other.md", ["a"]) != [ids[0]]
+
+
+def test_build_chunk_points_reuses_stored_vectors() -> None:
+    """Test only chunks without a stored point are sent for embedding."""
+    metadata = {"file_path": "note.md"}
+    unchanged_id = _chunk_point_ids("note.md", ["unchanged"])[0]
+    qdrant_client = MagicMock()
+    qdrant_client.retrieve.return_value = [MagicMock(id=unchanged_id, vector=[1.0])]
+    openai_client = MagicMock()
+    openai_client.embeddings.create.return_value = MagicMock(
+        data=[MagicMock(embedding=[2.0])]
+    )
+
+    points, embedded = _build_chunk_points(
+        qdrant_client,
+        openai_client,
+        "test-collection",
+        ["unchanged", "edited"],
+        metadata,
+        [unchanged_id, "stale-id"],
+    )
+
+    assert embedded == 1
+    assert openai_client.embeddings.create.call_args[1]["input"] == ["edited"]
+    assert qdrant_client.retrieve.call_args[1]["ids"] == [unchanged_id]
+    assert [point.vector for point in points] == [[1.0], [2.0]]
+    assert [point.payload["chunk_index"] for point in points] == [0, 1]
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
+from subprocess import CalledProcessError, CompletedProcess
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,8 +13,10 @@ import pytest
 from obsistant.qdrant.server import (
     _check_docker_available,
     _check_ports_available,
-    _container_exists,
+    _Container,
     _get_container_name,
+    _list_containers,
+    _wait_for_container,
     ensure_qdrant_storage,
     get_qdrant_storage_path,
     is_qdrant_running,
@@ -20,6 +25,38 @@ from obsistant.qdrant.server import (
 )
 
 
+class FakeSubprocess:
+    """Scripted stand-in for ``subprocess.run`` in the server module.
+
+    Tests append one result per expected docker command, in call order: the
+    stdout to return, or an exception to raise. The argument list of every
+    call is recorded in ``calls``.
+    """
+
+    def __init__(self) -> None:
+        self.results: list[str | BaseException] = []
+        self.calls: list[list[str]] = []
+
+    def __call__(self, args: list[str], **kwargs: Any) -> CompletedProcess[str]:
+        self.calls.append(args)
+        result = self.results.pop(0)
+        if isinstance(result, BaseException):
+            raise result
+        return CompletedProcess(args, 0, stdout=result, stderr="")
+
+
+@pytest.fixture
+def fake_subprocess(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeSubprocess]:
+    """Replace subprocess.run in the server module with a scripted fake.
+
+    Fails the test if any scripted result was left unused.
+    """
+    fake = FakeSubprocess()
+    monkeypatch.setattr("obsistant.qdrant.server.subprocess.run", fake)
+    yield fake
+    assert fake.results == [], "unused scripted docker results"
+
+
 class TestGetQdrantStoragePath:
     """Test get_qdrant_storage_path function."""
 
@@ -100,44 +137,23 @@ class TestGetContainerName:
 class TestCheckDockerAvailable:
     """Test _check_docker_available function."""
 
-    @patch("obsistant.qdrant.server.subprocess.run")
-    def test_docker_available_success(self, mock_run: MagicMock) -> None:
+    @patch("obsistant.qdrant.server.shutil.which")
+    def test_docker_available_success(
+        self, mock_which: MagicMock, fake_subprocess: FakeSubprocess
+    ) -> None:
         """Test that Docker availability check returns True when Docker is available."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        mock_which.return_value = "/usr/bin/docker"
 
         result = _check_docker_available()
 
         assert result is True
-        mock_run.assert_called_once()
+        mock_which.assert_called_once_with("docker")
+        assert fake_subprocess.calls == []
 
-    @patch("obsistant.qdrant.server.subprocess.run")
-    def test_docker_available_file_not_found(self, mock_run: MagicMock) -> None:
+    @patch("obsistant.qdrant.server.shutil.which")
+    def test_docker_available_file_not_found(self, mock_which: MagicMock) -> None:
         """Test that Docker availability check returns False when Docker is not found."""
-        mock_run.side_effect = FileNotFoundError()
-
-        result = _check_docker_available()
-
-        assert result is False
-
-    @patch("obsistant.qdrant.server.subprocess.run")
-    def test_docker_available_timeout(self, mock_run: MagicMock) -> None:
-        """Test that Docker availability check returns False on timeout."""
-        from subprocess import TimeoutExpired
-
-        mock_run.side_effect = TimeoutExpired("docker", 5)
-
-        result = _check_docker_available()
-
-        assert result is False
-
-    @patch("obsistant.qdrant.server.subprocess.run")
-    def test_docker_available_subprocess_error(self, mock_run: MagicMock) -> None:
-        """Test that Docker availability check returns False on subprocess error."""
-        import subprocess
-
-        mock_run.side_effect = subprocess.SubprocessError("Subprocess error")
+        mock_which.return_value = None
 
         result = _check_docker_available()
 
@@ -147,220 +163,228 @@ class TestCheckDockerAvailable:
 class TestCheckPortsAvailable:
     """Test _check_ports_available function."""
 
-    @patch("obsistant.qdrant.server.subprocess.run")
-    def test_ports_available_success(self, mock_run: MagicMock) -> None:
-        """Test that ports are available when not in use."""
-        mock_result = MagicMock()
-        mock_result.stdout = "0.0.0.0:8080->80/tcp"
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
-
-        result = _check_ports_available((6333, 6334))
-
-        assert result is True
-
-    @patch("obsistant.qdrant.server.subprocess.run")
-    def test_ports_available_http_port_in_use(self, mock_run: MagicMock) -> None:
-        """Test that ports check returns False when HTTP port is in use."""
-        mock_result = MagicMock()
-        mock_result.stdout = "0.0.0.0:6333->6333/tcp"
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
-
-        result = _check_ports_available((6333, 6334))
-
-        assert result is False
-
-    @patch("obsistant.qdrant.server.subprocess.run")
-    def test_ports_available_grpc_port_in_use(self, mock_run: MagicMock) -> None:
-        """Test that ports check returns False when gRPC port is in use."""
-        mock_result = MagicMock()
-        mock_result.stdout = "0.0.0.0:6334->6334/tcp"
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
-
-        result = _check_ports_available((6333, 6334))
-
-        assert result is False
-
-    @patch("obsistant.qdrant.server.subprocess.run")
-    def test_ports_available_error_returns_true(self, mock_run: MagicMock) -> None:
-        """Test that ports check returns True on error (assumes available)."""
-        mock_run.side_effect = FileNotFoundError()
-
-        result = _check_ports_available((6333, 6334))
+    @pytest.mark.parametrize(
+        ("published", "expected"),
+        [
+            ("0.0.0.0:8080->80/tcp", True),
+            ("0.0.0.0:6333->6333/tcp", False),
+            ("0.0.0.0:6334->6334/tcp", False),
+        ],
+    )
+    def test_ports_available(self, published: str, expected: bool) -> None:
+        """Test that ports published by any container count as in use."""
+        containers = [_Container("abc", "other", True, published)]
+
+        assert _check_ports_available((6333, 6334), containers) is expected
+
+    def test_ports_available_without_containers(self) -> None:
+        """Test that ports are assumed available when no containers are known."""
+        assert _check_ports_available((6333, 6334), []) is True
+
+
+class TestListContainers:
+    """Test _list_containers function."""
+
+    def test_list_containers(self, fake_subprocess: FakeSubprocess) -> None:
+        """Test that docker ps -a output is parsed into containers."""
+        fake_subprocess.results.append(
+            "abc\tqdrant\tUp 2 minutes\t0.0.0.0:6333->6333/tcp\n"
+            "def\told\tExited (0) 3 days ago\t\n"
+        )
+
+        assert _list_containers() == [
+            _Container("abc", "qdrant", True, "0.0.0.0:6333->6333/tcp"),
+            _Container("def", "old", False, ""),
+        ]
+        assert len(fake_subprocess.calls) == 1
+
+    def test_list_containers_error_returns_empty(
+        self, fake_subprocess: FakeSubprocess
+    ) -> None:
+        """Test that an unavailable docker CLI yields no containers."""
+        fake_subprocess.results.append(FileNotFoundError())
 
-        assert result is True
+        assert _list_containers() == []
 
 
-class TestContainerExists:
-    """Test _container_exists function."""
+class TestIsQdrantRunning:
+    """Test is_qdrant_running function."""
 
-    @patch("obsistant.qdrant.server.subprocess.run")
-    def test_container_exists_true(self, mock_run: MagicMock, tmp_path: Path) -> None:
-        """Test that container existence check returns True when container exists."""
+    def test_is_running_true(
+        self, fake_subprocess: FakeSubprocess, tmp_path: Path
+    ) -> None:
+        """Test that is_qdrant_running returns True when container is running."""
         vault_path = tmp_path / "vault"
         container_name = _get_container_name(vault_path)
+        fake_subprocess.results.append(f"{container_name}\n")
 
-        mock_result = MagicMock()
-        mock_result.stdout = f"{container_name}\n"
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
-
-        result = _container_exists(vault_path)
+        result = is_qdrant_running(vault_path)
 
         assert result is True
 
-    @patch("obsistant.qdrant.server.subprocess.run")
-    def test_container_exists_false(self, mock_run: MagicMock, tmp_path: Path) -> None:
-        """Test that container existence check returns False when container doesn't exist."""
+    def test_is_running_false(
+        self, fake_subprocess: FakeSubprocess, tmp_path: Path
+    ) -> None:
+        """Test that is_qdrant_running returns False when container is not running."""
         vault_path = tmp_path / "vault"
+        fake_subprocess.results.append("")
 
-        mock_result = MagicMock()
-        mock_result.stdout = ""
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
-
-        result = _container_exists(vault_path)
+        result = is_qdrant_running(vault_path)
 
         assert result is False
 
-    @patch("obsistant.qdrant.server.subprocess.run")
-    def test_container_exists_error_returns_false(
-        self, mock_run: MagicMock, tmp_path: Path
+    def test_is_running_error_returns_false(
+        self, fake_subprocess: FakeSubprocess, tmp_path: Path
     ) -> None:
-        """Test that container existence check returns False on error."""
+        """Test that is_qdrant_running returns False on error."""
         vault_path = tmp_path / "vault"
-        mock_run.side_effect = FileNotFoundError()
+        fake_subprocess.results.append(FileNotFoundError())
 
-        result = _container_exists(vault_path)
+        result = is_qdrant_running(vault_path)
 
         assert result is False
 
 
-class TestIsQdrantRunning:
-    """Test is_qdrant_running function."""
-
-    @patch("obsistant.qdrant.server.subprocess.run")
-    def test_is_running_true(self, mock_run: MagicMock, tmp_path: Path) -> None:
-        """Test that is_qdrant_running returns True when container is running."""
-        vault_path = tmp_path / "vault"
-        container_name = _get_container_name(vault_path)
-
-        mock_result = MagicMock()
-        mock_result.stdout = f"{container_name}\n"
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+class TestWaitForContainer:
+    """Test _wait_for_container function."""
 
-        result = is_qdrant_running(vault_path)
+    @patch("obsistant.qdrant.server.time.sleep")
+    def test_wait_polls_with_backoff_until_running(
+        self, mock_sleep: MagicMock, fake_subprocess: FakeSubprocess
+    ) -> None:
+        """Test that the container state is polled with growing delays."""
+        fake_subprocess.results.extend(
+            ["abc created \n", "abc running starting\n", "abc running healthy\n"]
+        )
+
+        assert _wait_for_container("qdrant") == "abc"
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.05, 0.1]
+
+    @pytest.mark.parametrize(
+        "stdout", ["abc exited \n", "abc dead \n", "abc running unhealthy\n"]
+    )
+    @patch("obsistant.qdrant.server.time.sleep")
+    def test_wait_fails_fast(
+        self, mock_sleep: MagicMock, fake_subprocess: FakeSubprocess, stdout: str
+    ) -> None:
+        """Test that a stopped or unhealthy container fails without waiting."""
+        fake_subprocess.results.append(stdout)
 
-        assert result is True
+        with pytest.raises(RuntimeError, match="failed to start"):
+            _wait_for_container("qdrant")
+        mock_sleep.assert_not_called()
 
-    @patch("obsistant.qdrant.server.subprocess.run")
-    def test_is_running_false(self, mock_run: MagicMock, tmp_path: Path) -> None:
-        """Test that is_qdrant_running returns False when container is not running."""
-        vault_path = tmp_path / "vault"
+    @patch("obsistant.qdrant.server.time.sleep")
+    def test_wait_times_out(
+        self, mock_sleep: MagicMock, fake_subprocess: FakeSubprocess
+    ) -> None:
+        """Test that a container that never becomes ready times out."""
+        fake_subprocess.results.append("abc created \n")
 
-        mock_result = MagicMock()
-        mock_result.stdout = ""
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        with pytest.raises(RuntimeError, match="was not ready"):
+            _wait_for_container("qdrant", timeout=0)
 
-        result = is_qdrant_running(vault_path)
+    @patch("obsistant.qdrant.server.time.sleep")
+    def test_wait_polls_again_on_incomplete_output(
+        self, mock_sleep: MagicMock, fake_subprocess: FakeSubprocess
+    ) -> None:
+        """Test that empty or truncated inspect output is polled again."""
+        fake_subprocess.results.extend(["", "abc\n", "abc running \n"])
 
-        assert result is False
+        assert _wait_for_container("qdrant") == "abc"
+        assert mock_sleep.call_count == 2
 
-    @patch("obsistant.qdrant.server.subprocess.run")
-    def test_is_running_error_returns_false(
-        self, mock_run: MagicMock, tmp_path: Path
+    @patch("obsistant.qdrant.server.time.sleep")
+    def test_wait_times_out_on_incomplete_output(
+        self, mock_sleep: MagicMock, fake_subprocess: FakeSubprocess
     ) -> None:
-        """Test that is_qdrant_running returns False on error."""
-        vault_path = tmp_path / "vault"
-        mock_run.side_effect = FileNotFoundError()
-
-        result = is_qdrant_running(vault_path)
+        """Test that output that never becomes complete times out."""
+        fake_subprocess.results.append("")
+
+        with pytest.raises(RuntimeError, match="was not ready"):
+            _wait_for_container("qdrant", timeout=0)
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            FileNotFoundError("docker"),
+            CalledProcessError(1, ["docker", "inspect"]),
+        ],
+    )
+    def test_wait_raises_runtime_error_when_inspect_fails(
+        self, fake_subprocess: FakeSubprocess, error: BaseException
+    ) -> None:
+        """Test that a missing docker binary or failed inspect is a RuntimeError."""
+        fake_subprocess.results.append(error)
 
-        assert result is False
+        with pytest.raises(RuntimeError, match="Failed to check the state"):
+            _wait_for_container("qdrant")
 
 
 class TestStartQdrantServer:
     """Test start_qdrant_server function."""
 
     @patch("obsistant.qdrant.server._check_docker_available")
-    @patch("obsistant.qdrant.server.is_qdrant_running")
-    @patch("obsistant.qdrant.server.subprocess.run")
+    @patch("obsistant.qdrant.server._list_containers")
     def test_start_server_already_running(
         self,
-        mock_run: MagicMock,
-        mock_is_running: MagicMock,
+        mock_list_containers: MagicMock,
         mock_docker_available: MagicMock,
+        fake_subprocess: FakeSubprocess,
         tmp_path: Path,
     ) -> None:
         """Test starting server when it's already running."""
         vault_path = tmp_path / "vault"
         vault_path.mkdir()
+        container_name = _get_container_name(vault_path)
 
         mock_docker_available.return_value = True
-        mock_is_running.return_value = True
-
-        mock_result = MagicMock()
-        mock_result.stdout = "container-id-123\n"
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        mock_list_containers.return_value = [
+            _Container("container-id-123", container_name, True, "")
+        ]
 
         container_id = start_qdrant_server(vault_path)
 
         assert container_id == "container-id-123"
-        # Should check if running and get container ID, but not start new container
-        assert mock_run.call_count >= 1
+        # The snapshot already has the ID, so no further docker commands run
+        mock_list_containers.assert_called_once()
+        assert fake_subprocess.calls == []
 
     @patch("obsistant.qdrant.server._check_docker_available")
-    @patch("obsistant.qdrant.server.is_qdrant_running")
-    @patch("obsistant.qdrant.server._container_exists")
-    @patch("obsistant.qdrant.server.subprocess.run")
+    @patch("obsistant.qdrant.server._list_containers")
     def test_start_server_existing_stopped_container(
         self,
-        mock_run: MagicMock,
-        mock_container_exists: MagicMock,
-        mock_is_running: MagicMock,
+        mock_list_containers: MagicMock,
         mock_docker_available: MagicMock,
+        fake_subprocess: FakeSubprocess,
         tmp_path: Path,
     ) -> None:
         """Test starting server when container exists but is stopped."""
         vault_path = tmp_path / "vault"
         vault_path.mkdir()
+        container_name = _get_container_name(vault_path)
 
         mock_docker_available.return_value = True
-        mock_is_running.return_value = False
-        mock_container_exists.return_value = True
+        mock_list_containers.return_value = [
+            _Container("container-id-456", container_name, False, "")
+        ]
 
-        # Mock docker start
-        mock_start_result = MagicMock()
-        mock_start_result.returncode = 0
-        # Mock docker ps to get container ID
-        mock_ps_result = MagicMock()
-        mock_ps_result.stdout = "container-id-456\n"
-        mock_ps_result.returncode = 0
-        mock_run.side_effect = [mock_start_result, mock_ps_result]
+        # docker start, then docker inspect reporting the container as running
+        fake_subprocess.results.extend(["", "container-id-456 running \n"])
 
         container_id = start_qdrant_server(vault_path)
 
         assert container_id == "container-id-456"
         # Should call docker start
-        assert any("start" in str(call) for call in mock_run.call_args_list)
+        assert fake_subprocess.calls[0][:2] == ["docker", "start"]
 
     @patch("obsistant.qdrant.server._check_docker_available")
-    @patch("obsistant.qdrant.server.is_qdrant_running")
-    @patch("obsistant.qdrant.server._container_exists")
-    @patch("obsistant.qdrant.server._check_ports_available")
-    @patch("obsistant.qdrant.server.subprocess.run")
+    @patch("obsistant.qdrant.server._list_containers")
     def test_start_server_new_container(
         self,
-        mock_run: MagicMock,
-        mock_ports_available: MagicMock,
-        mock_container_exists: MagicMock,
-        mock_is_running: MagicMock,
+        mock_list_containers: MagicMock,
         mock_docker_available: MagicMock,
+        fake_subprocess: FakeSubprocess,
         tmp_path: Path,
     ) -> None:
         """Test starting a new container."""
@@ -368,21 +392,20 @@ class TestStartQdrantServer:
         vault_path.mkdir()
 
         mock_docker_available.return_value = True
-        mock_is_running.return_value = False
-        mock_container_exists.return_value = False
-        mock_ports_available.return_value = True
+        mock_list_containers.return_value = [
+            _Container("other-id", "other", True, "0.0.0.0:8080->80/tcp")
+        ]
 
-        # Mock docker run
-        mock_run_result = MagicMock()
-        mock_run_result.stdout = "new-container-id-789\n"
-        mock_run_result.returncode = 0
-        mock_run.return_value = mock_run_result
+        # docker run, then docker inspect reporting the container as running
+        fake_subprocess.results.extend(
+            ["new-container-id-789\n", "new-container-id-789 running \n"]
+        )
 
         container_id = start_qdrant_server(vault_path, ports=(6333, 6334))
 
         assert container_id == "new-container-id-789"
         # Should call docker run
-        assert any("run" in str(call) for call in mock_run.call_args_list)
+        assert fake_subprocess.calls[0][:2] == ["docker", "run"]
 
     @patch("obsistant.qdrant.server._check_docker_available")
     def test_start_server_docker_not_available(
@@ -398,15 +421,12 @@ class TestStartQdrantServer:
             start_qdrant_server(vault_path)
 
     @patch("obsistant.qdrant.server._check_docker_available")
-    @patch("obsistant.qdrant.server.is_qdrant_running")
-    @patch("obsistant.qdrant.server._container_exists")
-    @patch("obsistant.qdrant.server.subprocess.run")
+    @patch("obsistant.qdrant.server._list_containers")
     def test_start_server_port_already_allocated(
         self,
-        mock_run: MagicMock,
-        mock_container_exists: MagicMock,
-        mock_is_running: MagicMock,
+        mock_list_containers: MagicMock,
         mock_docker_available: MagicMock,
+        fake_subprocess: FakeSubprocess,
         tmp_path: Path,
     ) -> None:
         """Test that starting server raises error when port is already allocated."""
@@ -414,14 +434,12 @@ class TestStartQdrantServer:
         vault_path.mkdir()
 
         mock_docker_available.return_value = True
-        mock_is_running.return_value = False
-        mock_container_exists.return_value = False
+        mock_list_containers.return_value = []
 
-        # Mock docker run to fail with port error
-        from subprocess import CalledProcessError
-
-        mock_error = CalledProcessError(1, "docker", stderr="port is already allocated")
-        mock_run.side_effect = mock_error
+        # docker run fails with a port error
+        fake_subprocess.results.append(
+            CalledProcessError(1, "docker", stderr="port is already allocated")
+        )
 
         with pytest.raises(RuntimeError, match="Port.*is already in use"):
             start_qdrant_server(vault_path)
@@ -432,12 +450,11 @@ class TestStopQdrantServer:
 
     @patch("obsistant.qdrant.server._check_docker_available")
     @patch("obsistant.qdrant.server.is_qdrant_running")
-    @patch("obsistant.qdrant.server.subprocess.run")
     def test_stop_server_success(
         self,
-        mock_run: MagicMock,
         mock_is_running: MagicMock,
         mock_docker_available: MagicMock,
+        fake_subprocess: FakeSubprocess,
         tmp_path: Path,
     ) -> None:
         """Test stopping server successfully."""
@@ -447,15 +464,13 @@ class TestStopQdrantServer:
         mock_docker_available.return_value = True
         mock_is_running.return_value = True
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
+        fake_subprocess.results.append("")
 
         result = stop_qdrant_server(vault_path)
 
         assert result is True
         # Should call docker stop
-        assert any("stop" in str(call) for call in mock_run.call_args_list)
+        assert fake_subprocess.calls[0][:2] == ["docker", "stop"]
 
     @patch("obsistant.qdrant.server._check_docker_available")
     @patch("obsistant.qdrant.server.is_qdrant_running")
@@ -491,12 +506,11 @@ class TestStopQdrantServer:
 
     @patch("obsistant.qdrant.server._check_docker_available")
     @patch("obsistant.qdrant.server.is_qdrant_running")
-    @patch("obsistant.qdrant.server.subprocess.run")
     def test_stop_server_error(
         self,
-        mock_run: MagicMock,
         mock_is_running: MagicMock,
         mock_docker_available: MagicMock,
+        fake_subprocess: FakeSubprocess,
         tmp_path: Path,
     ) -> None:
         """Test that stopping server raises error on failure."""
@@ -506,10 +520,9 @@ class TestStopQdrantServer:
         mock_docker_available.return_value = True
         mock_is_running.return_value = True
 
-        from subprocess import CalledProcessError
-
-        mock_error = CalledProcessError(1, "docker", stderr="Stop failed")
-        mock_run.side_effect = mock_error
+        fake_subprocess.results.append(
+            CalledProcessError(1, "docker", stderr="Stop failed")
+        )
 
         with pytest.raises(RuntimeError, match="Failed to stop Qdrant server"):
             stop_qdrant_server(vault_path)
@@ -1,11 +1,6 @@
 """Regression test for table corruption bug."""
 
-import tempfile
-from pathlib import Path
-
-from loguru import logger
-
-from obsistant.vault import process_vault
+from obsistant.core import format_markdown
 
 
 def test_table_corruption_regression() -> None:
@@ -26,53 +21,33 @@ Here is a simple pipe table:
 
 This should be properly formatted as a table."""
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        test_file = temp_path / "test_table.md"
-
-        # Write the test file
-        test_file.write_text(original_content)
-
-        # Process the file with formatting enabled
-        process_vault(
-            root=str(temp_path),
-            dry_run=False,
-            backup_ext=".bak",
-            logger=logger,
-            format_md=True,
-            specific_file=test_file,
-        )
-
-        # Read the processed content
-        processed_content = test_file.read_text()
-
-        # The table should still have separate lines for each row
-        # Currently this test will FAIL because of the bug
-        lines = processed_content.split("\n")
-
-        # Find the table section (after the frontmatter)
-        table_lines = []
-        in_table = False
-        for line in lines:
-            if line.startswith("|") and "Header" in line:
-                in_table = True
-            if in_table:
-                if line.startswith("|"):
-                    table_lines.append(line)
-                elif line.strip() == "":
-                    if table_lines:  # End of table
-                        break
-
-        # Assert that we have the expected number of table lines
-        # Currently this will fail because all table content is collapsed into one line
-        assert len(table_lines) >= 4, (
-            f"Expected at least 4 table lines but got {len(table_lines)}: {table_lines}"
-        )
-
-        # Each row should be on a separate line
-        assert "Header 1" in table_lines[0]
-        assert "Row 1 Col 1" in table_lines[2]  # After header separator
-        assert "Row 2 Col 1" in table_lines[3]
+    processed_content = format_markdown(original_content)
+
+    # The table should still have separate lines for each row
+    lines = processed_content.split("\n")
+
+    # Find the table section
+    table_lines = []
+    in_table = False
+    for line in lines:
+        if line.startswith("|") and "Header" in line:
+            in_table = True
+        if in_table:
+            if line.startswith("|"):
+                table_lines.append(line)
+            elif line.strip() == "":
+                if table_lines:  # End of table
+                    break
+
+    # Assert that we have the expected number of table lines
+    assert len(table_lines) >= 4, (
+        f"Expected at least 4 table lines but got {len(table_lines)}: {table_lines}"
+    )
+
+    # Each row should be on a separate line
+    assert "Header 1" in table_lines[0]
+    assert "Row 1 Col 1" in table_lines[2]  # After header separator
+    assert "Row 2 Col 1" in table_lines[3]
 
 
 if __name__ == "__main__":
@@ -53,22 +53,20 @@ class TestTableFormatting:
 
     def test_format_markdown_returns_unchanged_when_plugin_absent(self) -> None:
         """Test that format_markdown returns input unchanged when mdformat-gfm plugin is absent."""
-        # Mock the mdformat.text function to raise ValueError on first call (with extensions),
-        # then also raise an exception on the fallback (without extensions) to simulate
-        # complete plugin failure
+        # Mock the mdformat.text function to raise ValueError to simulate complete
+        # plugin failure
         with unittest.mock.patch(
             "obsistant.core.formatting.mdformat.text"
         ) as mock_text:
-            mock_text.side_effect = [
-                ValueError("nonexistent"),
-                ValueError("no fallback"),
-            ]
+            mock_text.side_effect = ValueError("nonexistent")
             with unittest.mock.patch(
                 "obsistant.core.formatting.console.print"
             ) as mock_print:
                 result = format_markdown(RAW_TABLE_MD)
                 # Should have printed warning
                 mock_print.assert_called_once()
+                # Tables are never retried without extensions
+                assert mock_text.call_count <= 1
                 # When plugin is absent and table is detected, should return input unchanged
                 assert result == RAW_TABLE_MD
 
@@ -78,10 +76,7 @@ class TestTableFormatting:
         with unittest.mock.patch(
             "obsistant.core.formatting.mdformat.text"
         ) as mock_text:
-            mock_text.side_effect = [
-                ValueError("nonexistent"),
-                ValueError("no fallback"),
-            ]
+            mock_text.side_effect = ValueError("nonexistent")
             with unittest.mock.patch(
                 "obsistant.core.formatting.console.print"
             ) as mock_print:
@@ -109,9 +104,12 @@ Some more text.
 """
 
         # Mock mdformat to simulate plugin unavailable, but should still work for non-table content
-        with unittest.mock.patch(
-            "obsistant.core.formatting.mdformat.text"
-        ) as mock_text:
+        with (
+            unittest.mock.patch(
+                "obsistant.core.formatting.MDFORMAT_GFM_AVAILABLE", True
+            ),
+            unittest.mock.patch("obsistant.core.formatting.mdformat.text") as mock_text,
+        ):
             # First call raises ImportError (simulating missing gfm plugin)
             # Second call in fallback should work normally
             mock_text.side_effect = [
@@ -128,3 +126,21 @@ Some more text.
                 # Should have called mdformat.text twice (first fails, second succeeds)
                 assert mock_text.call_count == 2
                 assert result == text_without_table
+
+    def test_format_markdown_no_retry_without_extensions(self) -> None:
+        """Test that a failure without GFM requested is not retried identically."""
+        text_without_table = "# No Table Here\n\n- A bullet list\n"
+
+        with (
+            unittest.mock.patch(
+                "obsistant.core.formatting.MDFORMAT_GFM_AVAILABLE", False
+            ),
+            unittest.mock.patch(
+                "obsistant.core.formatting.mdformat.text",
+                side_effect=ValueError("broken"),
+            ) as mock_text,
+        ):
+            result = format_markdown(text_without_table)
+
+        assert mock_text.call_count == 1
+        assert result == text_without_table